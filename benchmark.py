@@ -0,0 +1,185 @@
+"""
+Benchmarks of the data paths of fitness.py on synthetic logs.
+
+Every log is generated in a temporary folder in the format the app writes, then loading, appending,
+deleting, averaging and drawing the graph are timed headlessly with the Agg backend.
+The results are printed and can be saved as JSON to compare runs on different commits:
+
+    python benchmark.py --sizes 1000 10000 100000 1000000 --output results.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import fitness
+
+kinds = ['weight', 'strength', 'cardio', 'meditation']
+exercises = ['BENCH', 'SQUAT', 'DEADLIFT', 'OHP', 'ROW', 'CURL', 'DIP', 'PULLUP']
+# Columns averaged and drawn for each log, strength draws one_rm once per exercise
+logMetrics = {'weight': ['weight'], 'strength': ['one_rm'], 'cardio': ['speed', 'distance', 'time'], 'meditation': ['rating', 'length']}
+
+def log_file(kind):
+    """
+    Function to get the file name the app uses for a kind of log.
+    """
+    return {'weight': fitness.weightFile, 'strength': fitness.strengthFile, 'cardio': fitness.cardioFile, 'meditation': fitness.meditationFile}[kind]
+
+def make_entry(kind, date, rng):
+    """
+    Function to make one random entry of a kind of log, with values as strings like the entry popups give them.
+    """
+    if kind == 'weight':
+        entry = {'weight': f'{rng.uniform(150, 200):.1f}'}
+    elif kind == 'strength':
+        entry = {'exercise': rng.choice(exercises), 'weight': str(rng.randrange(45, 400, 5)), 'reps': str(rng.randint(1, 12))}
+    elif kind == 'cardio':
+        entry = {'distance': f'{rng.uniform(1, 13):.2f}', 'minutes': str(rng.randint(8, 120)), 'seconds': str(rng.randint(0, 59))}
+    else:
+        entry = {
+            'rating': str(rng.randint(0, 10)),
+            'length': str(rng.randint(5, 60)),
+            'position': rng.choice(['Sitting', 'Laying']),
+            'sound': rng.choice(['Music', 'Ambience', 'Music + Ambience', 'Silent', 'Guided']),
+            'inorout': rng.choice(['Inside', 'Outside']),
+        }
+    entry['date'] = date.strftime('%m-%d-%Y')
+    return entry
+
+def generate(kind, size, rng):
+    """
+    Function to write a snapshot of size entries and an empty journal for a kind of log.
+    The entries are spread over at most ten years up to today, oldest first.
+    """
+    days = min(size, 3650)
+    today = datetime.today()
+    entries = []
+    for i in range(size):
+        entry = make_entry(kind, today - timedelta(days=days - 1 - i * days // size), rng)
+        entry['id'] = i + 1
+        entries.append(entry)
+    file = log_file(kind)
+    fitness.writeFile(file, entries)
+    open(file + fitness.journalSuffix, 'w').close()
+    if fitness.storageBackend == 'sqlite':
+        fitness.migrateToSqlite([file])
+
+def reset():
+    """
+    Function to forget every log fitness.py has loaded, so the next read goes to disk.
+    Queued journal writes are flushed first, so a timer can't flush them into the next log's journal.
+    """
+    fitness.flushWrites()
+    for state in (fitness.datasetCache, fitness.columnCache, fitness.dataVersions, fitness.nextIds, fitness.journalCounts):
+        state.clear()
+
+def timed(results, kind, size, phase, function, ops=1):
+    """
+    Function to run function once, add its time to results and return what it returned.
+    """
+    start = time.perf_counter()
+    value = function()
+    seconds = time.perf_counter() - start
+    results.append({'kind': kind, 'size': size, 'phase': phase, 'seconds': seconds, 'ops': ops, 'per_op': seconds / ops})
+    print(f'{kind:>10} {size:>8} {phase:<12} {seconds * 1000:10.2f} ms  {seconds / ops * 1e6:10.1f} us/op')
+    return value
+
+def render(kind, columns):
+    """
+    Function to build the graph of a log and draw it once with the Agg canvas.
+    """
+    graph = fitness.create_graph(*fitness.graphTitles[kind])
+    graph['canvas'] = FigureCanvasAgg(graph['fig'])
+    if kind == 'strength':
+        for code, exercise in enumerate(columns.labels['exercise']):
+            rows = columns.rows(code)
+            fitness.update_line(graph, exercise, columns['date'][rows], columns['one_rm'][rows])
+    else:
+        for name in logMetrics[kind]:
+            fitness.update_line(graph, name, columns.live('date'), columns.live(name))
+    fitness.redraw_graph(graph, datetime.today() - timedelta(days=3650))  # draw_idle() draws straight away on Agg
+
+def averages(kind, file, columns):
+    """
+    Function to work out every average a screen shows, strength gets them for every exercise.
+    """
+    codes = list(columns.index) if kind == 'strength' else [None]
+    for code in codes:
+        for days in fitness.averageWindows:
+            fitness.windowAverages(file, columns, logMetrics[kind], days, code)
+
+def bench(kind, size, ops, rng):
+    """
+    Function to run every benchmark of one kind and size of log.
+    """
+    results = []
+    file = log_file(kind)
+    reset()  # Writes still queued for the last log are flushed before its files are replaced
+    generate(kind, size, rng)
+    reset()
+    entries = timed(results, kind, size, 'load', lambda: fitness.readFile(file, {}, None))
+    columns = timed(results, kind, size, 'columns', lambda: fitness.getColumns(file, entries, kind))
+    timed(results, kind, size, 'cached_read', lambda: fitness.readFile(file, entries, None))
+    timed(results, kind, size, 'aggregate', lambda: averages(kind, file, columns))
+    timed(results, kind, size, 'aggregate_hot', lambda: averages(kind, file, columns))
+    today = datetime.today()
+    # Adds and deletes are only queued for the journal, flushing them makes the disk writes part of the time
+    timed(results, kind, size, 'append', lambda: ([fitness.store_entry(entries, file, make_entry(kind, today, rng)) for i in range(ops)], fitness.flushWrites()), ops)
+    ids = rng.sample(list(entries), min(ops, len(entries)))
+    timed(results, kind, size, 'delete', lambda: ([fitness.remove_entry(entries, file, entry_id) for entry_id in ids], fitness.flushWrites()), len(ids))
+    timed(results, kind, size, 'render', lambda: render(kind, columns))
+    # Let a compaction started by the appends finish before the files are replaced
+    while fitness.compacting:
+        time.sleep(0.01)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the data paths of fitness.py on synthetic logs')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000, 1000000], help='entries in each generated log')
+    parser.add_argument('--kinds', nargs='+', choices=kinds, default=kinds, help='logs to benchmark')
+    parser.add_argument('--ops', type=int, default=100, help='entries appended and deleted in the append and delete phases')
+    parser.add_argument('--storage', choices=['journal', 'sqlite'], default=fitness.storageBackend, help='storage backend to benchmark')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random entries')
+    parser.add_argument('--output', help='file to save the results to as JSON')
+    args = parser.parse_args()
+
+    fitness.storageBackend = args.storage
+    fitness.loadPlotting()
+    fitness.plottingThread.join()
+    folder = os.path.dirname(os.path.abspath(__file__))
+    commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=folder, capture_output=True, text=True).stdout.strip()
+    rng = random.Random(args.seed)
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        for size in args.sizes:
+            for kind in args.kinds:
+                results.extend(bench(kind, size, args.ops, rng))
+        os.chdir(folder)
+    report = {
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'storage': args.storage,
+        'ops': args.ops,
+        'seed': args.seed,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'Results saved to {args.output}')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
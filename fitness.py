@@ -1,854 +1,2739 @@
-import json
-import PySimpleGUI as sg
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-import numpy as np
-from datetime import datetime, timedelta
-
-# Define the window title and file paths
-windowTitle = 'Health & Fitness'
-titlebarIcon = 'icon.png'
-strengthFile = 'strength.json'
-cardioFile = 'cardio.json'
-meditationFile = 'meditation.json'
-weightFile = 'weight.json'
-
-# Set the theme for the GUI
-sg.theme('Python Plus')
-
-def readFile(filename, list1, window):
-    """
-    Function to read a file and load its content.
-    If the file is empty, it prints 'Empty' to the window output.
-    """
-    try:
-        with open(filename, 'r') as f:
-            list1 = json.load(f)
-            return list1
-    except json.decoder.JSONDecodeError:
-        window['-OUTPUT-'].print('Empty')
-        return []
-
-def writeFile(filename, list):
-    """
-    Function to write a list into a file.
-    """
-    with open(filename, 'w') as f:
-        json.dump(list, f)
-
-def add_entry(window, list, file, entry):
-    """
-    Function to add an entry to a list and write it to a file.
-    If the input is invalid, it shows a popup with 'Invalid Input'.
-    """
-    try:
-        list.append(entry)
-        writeFile(file, list)
-        window.un_hide()
-    except:
-        sg.popup('Invalid Input', font=(0,10), no_titlebar=True)
-        window.un_hide()
-
-def delete_entry(window, list, file):
-    """
-    Function to delete an entry from a list and update the file.
-    If the input is invalid, it shows a popup with 'Invalid Input'.
-    """
-    try:
-        window.hide()
-        entry = sg.PopupGetText('Number: ')
-        if entry == None:
-            pass
-        else:
-            list.remove(list[int(entry) -1])
-            for i in range(len(list)):
-                list[i]['number'] = i+1
-            writeFile(file, list)
-        window.un_hide()
-    except:
-        sg.popup('Invalid Input', font=(0,10), no_titlebar=True)
-        window.un_hide()
-
-
-def strength():
-    """
-    Opens the strength training GUI.
-
-    This function creates the GUI window for strength training,
-    including the main menu, options menu, and output window.
-    It also creates the graph for exercise progress.
-    """
-    open_strength()
-    # Declare Variables
-    strengthList = []
-    global strengthFig
-    toolbar = None
-    canvas_agg = None
-    weight_repsList = []
-    selected_exercise = 0
-    default_exercise = ''
-    
-    while True:
-        datePerExercise = []
-        # Read file to list
-        strengthList = readFile(strengthFile, strengthList, strengthWindow) 
-        number = len(strengthList) + 1 
-        # Create graph
-        strengthFig, ax = plt.subplots() 
-        # Create a set of exercises so they won't be reused to label in the graph
-        exercises = set(i['exercise'] for i in strengthList) 
-
-        for exercise in exercises:
-            # Get data for this exercise
-            exercise_data = [i for i in strengthList if i['exercise'] == exercise]  
-            # Get each date for the exercise
-            dates = [datetime.strptime(i['date'], '%m-%d-%Y') for i in exercise_data] 
-            # Get the strength level for the exercises
-            # weight / ( 1.0278 – 0.0278 × reps ) - 1 REP MAX EQUATION
-            weights_reps = [float(i['weight']) / (1.0278 - 0.0278 * float(i['reps'])) for i in exercise_data] 
-            # Plot the exercise
-            ax.plot(dates, weights_reps, marker='o', label=exercise) 
-            weight_repsList.append(weights_reps)
-            datePerExercise.append(dates)
-
-        for i in strengthList:
-            strengthWindow['-OUTPUT-'].print(f'{i['number']}. {i['exercise']}: {i['weight']} Lbs, {i['reps']} Reps        -        {i['date']}')
-
-        # Conversion from set to list
-        exercises = list(exercises) 
-        # Change default exercise for option menu
-        try:
-            if default_exercise == '': 
-                default_exercise = exercises[len(exercises)-1]
-        except IndexError:
-            pass
-        # Update option menu
-        strengthWindow['OPTIONS'].update(values=exercises, value=default_exercise) 
-
-
-        # Get the days average
-        current_date = datetime.today()
-        week_ago = current_date - timedelta(days=7)
-        current_date = datetime.today()
-        weeks_ago = current_date - timedelta(days=30)
-        weekly = 0.0
-        divid = 0
-        weekly2 = 0.0
-        divid2 = 0
-        try:
-            weights_reps = weight_repsList[selected_exercise]
-            dates = datePerExercise[selected_exercise]
-            for i in range(len(dates)):
-                if week_ago <= dates[i] <= current_date:
-                    weekly += weights_reps[i]
-                    divid+=1
-            for i in range(len(dates)):
-                if weeks_ago <= dates[i] <= current_date:
-                    weekly2 += weights_reps[i]
-                    divid2+=1
-            if divid == 0:
-                divid = 1
-            if divid2 == 0:
-                divid2 = 1
-            strengthWindow['WEEKLY'].update(f'7 Day Average: {weekly/divid:.2f}\n30 Day Average: {weekly2/divid2:.2f}')
-        except:
-            pass
-
-
-        # Format the x axis to use date time
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d-%Y')) 
-        start_date = datetime(2024, 1, 1)  # Start date
-        end_date = datetime.today()  # End date
-        ax.set_xlim(start_date, end_date) # Limit the x axis
-        strengthFig.autofmt_xdate() # Update the graph
-        plt.title('Exercise Progress') # Title
-        plt.xlabel('Date') # X Label
-        plt.ylabel('Strength') # Y Label
-        plt.legend() # Legend
-        plt.grid() # Grid
-
-        if canvas_agg: # If graph exists, delete graph. (For updating graph)
-            canvas_agg.get_tk_widget().forget()
-            toolbar.forget()
-        # Create graph
-        canvas_agg = FigureCanvasTkAgg(strengthFig, master=strengthWindow['-CANVAS-'].TKCanvas) 
-        # Create toolbar
-        toolbar = NavigationToolbar2Tk(canvas_agg, strengthWindow['-CANVAS-'].TKCanvas) 
-        toolbar.update() # Update toolbar
-        canvas_agg.draw() # Draw graph
-
-        canvas_agg.get_tk_widget().pack(side='top', fill='both', expand=1) # Fill canvas with graph
-
-        # Read event from GUI input
-        event, values = strengthWindow.read() 
-        strengthWindow['-OUTPUT-'].update('')
-        try:
-            selected_exercise = exercises.index(values['OPTIONS'])
-        except:
-            selected_exercise = ''
-        weight_repsList = []
-
-        try:
-            default_exercise = exercises[exercises.index(values['OPTIONS'])]
-        except:
-            pass
-
-        if event == 'Weight':
-            strengthWindow.close()
-            main_menu()
-        elif event == 'Cardio':
-            strengthWindow.close()
-            cardio()
-        elif event == 'Meditation':
-            strengthWindow.close()
-            meditation()
-        if event == 'Add Entry':
-            strengthWindow['-OUTPUT-'].update('')
-            strengthWindow.hide()
-            entry1 = sg.PopupGetText('Exercise: ')
-            if entry1 == None:
-                strengthWindow.un_hide()
-                pass
-            else:
-                entry2 = sg.PopupGetText('Weight: ')
-                if entry2 == None:
-                    strengthWindow.un_hide()
-                    pass  
-                else:
-                    entry3 = sg.PopupGetText('Reps: ')
-                    if entry3 == None:
-                        strengthWindow.un_hide()
-                        pass
-                    else:
-                        entry = {
-                            'number': number,
-                            'exercise': entry1.upper(),
-                            'weight': entry2,
-                            'reps': entry3,
-                            'date': datetime.today().strftime('%m-%d-%Y')
-                        }
-                        add_entry(strengthWindow, strengthList, strengthFile, entry)
-        elif event == 'Delete Entry':
-            strengthWindow['-OUTPUT-'].update('')
-            delete_entry(strengthWindow, strengthList, strengthFile)
-        elif event == 'Exit' or sg.WIN_CLOSED:
-            strengthWindow.close()
-            exit()
-
-def cardio():
-    """
-    This function displays a cardio progress window with a graph and data.
-
-    It allows users to add new entries, delete entries, and navigate to other fitness applications.
-    """
-
-    # Open cardio file and initialize variables
-    open_cardio()
-    cardioList = []
-    global cardioFig
-    canvas_agg = None
-    toolbar = None
-
-    while True:
-        # Read data from cardio file and update list
-        cardioList = readFile(cardioFile, cardioList, cardioWindow)
-        number = len(cardioList) + 1
-
-        # Create figure and subplots for the graph
-        cardioFig, ax = plt.subplots()
-        dates = []
-        speeds = []
-        distances = []
-        times = []
-
-        # Iterate through each entry in the list
-        for i in cardioList:
-            # Add leading zero to seconds if needed
-            if len(i['seconds']) == 1:
-                i['seconds'] = f'0{i['seconds']}'
-
-            # Calculate speed and print data to output window
-            speed = float(float(i['distance']) / (float(i['minutes']) + (float(i['seconds']) / 60)) * 60)
-            cardioWindow['-OUTPUT-'].print(f'{i["number"]}. {i["distance"]} Miles: {i["minutes"]}:{i["seconds"]}, {round(speed, 2)} MPH        -        {i["date"]}')
-
-            # Convert date to datetime object and append data to lists
-            date = datetime.strptime(i['date'], '%m-%d-%Y')
-            dates.append(date)
-            speeds.append(speed)
-            distances.append(float(i['distance']))
-            times.append(float(i['minutes']) + (float(i['seconds']) / 60))
-
-        # Calculate weekly and monthly averages
-        current_date = datetime.today()
-        week_ago = current_date - timedelta(days=7)
-        current_date = datetime.today()
-        weeks_ago = current_date - timedelta(days=30)
-        weekly = 0.0
-        divid = 0
-        weekly2 = 0.0
-        divid2 = 0
-        weeklyD = 0.0
-        weeklyD2 = 0.0
-        weeklyT = 0.0
-        weeklyT2 = 0.0
-
-        for i in range(len(dates)):
-            if week_ago <= dates[i] <= current_date:
-                weekly += speeds[i]
-                weeklyD += distances[i]
-                weeklyT += times[i]
-                divid += 1
-        for i in range(len(dates)):
-            if weeks_ago <= dates[i] <= current_date:
-                weekly2 += speeds[i]
-                weeklyD2 += distances[i]
-                weeklyT2 += times[i]
-                divid2 += 1
-
-        if divid == 0:
-            divid = 1
-        if divid2 == 0:
-            divid2 = 1
-
-        # Update weekly and monthly average text in window
-        cardioWindow['WEEKLY'].update(f'7 Day Average:   {round(weeklyD/divid, 2)} Miles:   {round(weeklyT/divid, 2)} Minutes,   {round(weekly/divid, 2)} MPH\n30 Day Average:   {round(weeklyD2/divid2, 2)} Miles:   {round(weeklyT2/divid2, 2)} Minutes,   {round(weekly2/divid2, 2)} MPH')
-
-        # Create line plots for speed, distance, and time
-        ax.plot(dates, speeds, marker='o', label='Speed')
-        ax.plot(dates, distances, marker='v', label='Distance')
-        ax.plot(dates, times, marker='s', label='Time')
-
-        # Set axis formatting and limits
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d-%Y'))
-        cardioFig.autofmt_xdate()
-        start_date = datetime(2024, 1, 17)
-        end_date = datetime.today()
-        ax.set_ylim(0)
-        ax.set_xlim(start_date, end_date)
-
-        # Set title, labels, and grid
-        plt.title('Cardio Progress')
-        plt.xlabel('Date')
-        plt.ylabel('Speed/Distance/Time')
-        plt.legend()
-        plt.grid()
-
-        # Update and display the plot
-        if canvas_agg:
-            # Remove old plot and toolbar
-            canvas_agg.get_tk_widget().forget()
-            toolbar.forget()
-
-        # Create new canvas and toolbar
-        canvas_agg = FigureCanvasTkAgg(cardioFig, master=cardioWindow['-CANVAS-'].TKCanvas)
-        canvas_agg.draw()
-        toolbar = NavigationToolbar2Tk(canvas_agg, cardioWindow['-CANVAS-'].TKCanvas)
-        toolbar.update()
-
-        # Pack the canvas widget
-        canvas_agg.get_tk_widget().pack(side='top', fill='both', expand=1)
-
-        # Read user event from window
-        event, values = cardioWindow.read()
-
-        # Handle button clicks
-        if event == 'Strength':
-            # Close cardio window and open strength window
-            cardioWindow.close()
-            strength()
-        elif event == 'Weight':
-            # Close cardio window and open main menu
-            cardioWindow.close()
-            main_menu()
-        elif event == 'Meditation':
-            # Close cardio window and open meditation window
-            cardioWindow.close()
-            meditation()
-        elif event == 'Add Entry':
-            # Clear output window and hide cardio window
-            cardioWindow['-OUTPUT-'].update('')
-            cardioWindow.hide()
-
-            # Get distance input from user
-            entry1 = sg.PopupGetText('Distance in miles: ')
-
-            # Validate distance input
-            if entry1 is None or not entry1.replace('.', '', 1).isdigit():
-                # Show error message and unhide window
-                cardioWindow.un_hide()
-                pass
-            else:
-                # Get minutes input from user
-                entry2 = sg.PopupGetText('Minutes: ')
-
-                # Validate minutes input
-                if entry2 is None or not entry2.isdigit():
-                    # Show error message and unhide window
-                    cardioWindow.un_hide()
-                    pass
-                else:
-                    # Get seconds input from user
-                    entry3 = sg.PopupGetText('Seconds: ')
-
-                    # Validate seconds input
-                    if entry3 is None or not entry3.isdigit():
-                        # Show error message and unhide window
-                        cardioWindow.un_hide()
-                        pass
-                    else:
-                        # Create new entry dictionary
-                        entry = {
-                            'number': number,
-                            'distance': entry1,
-                            'minutes': entry2,
-                            'seconds': entry3,
-                            'date': datetime.today().strftime('%m-%d-%Y')
-                        }
-
-                        # Add entry to list and update file
-                        add_entry(cardioWindow, cardioList, cardioFile, entry)
-
-        elif event == 'Delete Entry':
-            # Clear output window and delete entry
-            cardioWindow['-OUTPUT-'].update('')
-            delete_entry(cardioWindow, cardioList, cardioFile)
-        elif event == 'Exit' or sg.WIN_CLOSED:
-            # Close cardio window and exit program
-            cardioWindow.close()
-            exit()
-
-def meditation():
-    """
-    This function displays a meditation progress window with a graph and data.
-
-    It allows users to add new entries, delete entries, and navigate to other fitness applications.
-    """
-
-    # Open meditation file and initialize variables
-    open_meditation()
-    meditationList = []
-    global meditationFig
-    canvas_agg = None
-    toolbar = None
-
-    while True:
-        # Read data from meditation file and update list
-        meditationList = readFile(meditationFile, meditationList, meditationWindow)
-        number = len(meditationList) + 1
-
-        # Create figure and subplots for the graph
-        meditationFig, ax = plt.subplots()
-        dates = []
-        ratings = []
-        times = []
-
-        # Iterate through each entry in the list
-        for i in meditationList:
-            # Print data to output window
-            meditationWindow['-OUTPUT-'].print(f'{i["number"]}. {i["rating"]}/10:   {i["length"]} Minutes,   {i["position"]}, {i["inorout"]}, {i["sound"]}        -        {i["date"]}')
-
-            # Convert date to datetime object and append data to lists
-            date = datetime.strptime(i['date'], '%m-%d-%Y')
-            rating = float(i['rating'])
-            time = float(i['length'])
-            dates.append(date)
-            ratings.append(rating)
-            times.append(time)
-
-        # Calculate weekly and monthly averages
-        current_date = datetime.today()
-        week_ago = current_date - timedelta(days=7)
-        current_date = datetime.today()
-        weeks_ago = current_date - timedelta(days=30)
-        weekly = 0.0
-        divid = 0
-        weekly2 = 0.0
-        divid2 = 0
-        weeklyT = 0.0
-        weeklyT2 = 0.0
-
-        for i in range(len(dates)):
-            if week_ago <= dates[i] <= current_date:
-                weekly += ratings[i]
-                weeklyT += times[i]
-                divid += 1
-        for i in range(len(dates)):
-            if weeks_ago <= dates[i] <= current_date:
-                weekly2 += ratings[i]
-                weeklyT2 += times[i]
-                divid2 += 1
-
-        if divid == 0:
-            divid = 1
-        if divid2 == 0:
-            divid2 = 1
-
-        # Update weekly and monthly average text in window
-        meditationWindow['WEEKLY'].update(f'7 Day Average:   {round(weekly/divid, 2)}/10:   {round(weeklyT/divid, 2)} Minutes\n30 Day Average:   {round(weekly2/divid2, 2)}/10:   {round(weeklyT2/divid2, 2)} Minutes')
-
-        # Create line plots for ratings and time
-        ax.plot(dates, ratings, marker='o', label='Rating')
-        ax.plot(dates, times, marker='s', label='Minutes')
-
-        # Set axis formatting and limits
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d-%Y'))
-        meditationFig.autofmt_xdate()
-        start_date = datetime(2024, 1, 17)
-        end_date = datetime.today()
-        ax.set_ylim(0)
-        ax.set_xlim(start_date, end_date)
-
-        # Set title, labels, and grid
-        plt.title('Meditation Ratings')
-        plt.xlabel('Date')
-        plt.ylabel('Rating & Minutes')
-        plt.legend()
-        plt.grid()
-
-        # Update and display the plot
-        if canvas_agg:
-            # Remove old plot and toolbar
-            canvas_agg.get_tk_widget().forget()
-            toolbar.forget()
-
-        # Create new canvas and toolbar
-        canvas_agg = FigureCanvasTkAgg(meditationFig, master=meditationWindow['-CANVAS-'].TKCanvas)
-        canvas_agg.draw()
-        toolbar = NavigationToolbar2Tk(canvas_agg, meditationWindow['-CANVAS-'].TKCanvas)
-        toolbar.update()
-        canvas_agg.get_tk_widget().pack(side='top', fill='both', expand=1)
-
-        # Read user event from window
-        event, values = meditationWindow.read()
-
-        # Handle button clicks
-        if event == 'Strength':
-            # Close meditation window and open strength window
-            meditationWindow.close()
-            strength()
-        elif event == 'Cardio':
-            # Close meditation window and open cardio window
-            meditationWindow.close()
-            cardio()
-        elif event == 'Weight':
-            # Close meditation window and open main menu
-            meditationWindow.close()
-            main_menu()
-        elif event == 'Add Entry':
-            # Clear output window and hide meditation window
-            meditationWindow['-OUTPUT-'].update('')
-            meditationWindow.hide()
-
-            # Get rating input from user
-            entry1 = sg.PopupGetText('Rating from 0 - 10: ')
-
-            # Validate rating input
-            if entry1 is None or not entry1.replace('.', '', 1).isdigit() or int(entry1) < 0 or int(entry1) > 10:
-                # Show error message and unhide window
-                meditationWindow.un_hide()
-                pass
-            else:
-                # Get length input from user
-                entry2 = sg.PopupGetText('Length in minutes: ')
-
-                # Validate length input
-                if entry2 is None or not entry2.replace('.', '', 1).isdigit():
-                    # Show error message and unhide window
-                    meditationWindow.un_hide()
-                    pass
-                else:
-                    # Open window to choose sitting or laying position
-                    entry3Window = sg.Window('Sitting or Laying?', layout=[[sg.Button('Sitting'), sg.Button('Laying'), sg.Button('Cancel')]])
-                    entry3, values = entry3Window.read()
-                    entry3Window.close()
-
-                    # If user cancels, unhide the meditation window
-                    if entry3 == 'Cancel':
-                        meditationWindow.un_hide()
-                        pass
-                    else:
-                        # If laying, ask if it was yesterday
-                        yesterday = 'No'
-                        if entry3 == 'Laying':
-                            yesterday = sg.popup_yes_no('Was the meditation yesterday?')
-
-                        # Open window to choose sound type
-                        entry4Window = sg.Window('Sound?', layout=[[sg.Button('Music'), sg.Button('Ambience'), sg.Button('Music + Ambience'), sg.Button('Silent'), sg.Button('Guided'), sg.Button('Cancel')]])
-                        entry4, values = entry4Window.read()
-                        entry4Window.close()
-
-                        # If user cancels, unhide the meditation window
-                        if entry4 == 'Cancel':
-                            meditationWindow.un_hide()
-                            pass
-                        else:
-                            # Open window to choose inside or outside location
-                            entry5Window = sg.Window('Inside or Outside?', layout=[[sg.Button('Inside'), sg.Button('Outside'), sg.Button('Cancel')]])
-                            entry5, values = entry5Window.read()
-                            entry5Window.close()
-
-                            # If user cancels, unhide the meditation window
-                            if entry5 == 'Cancel':
-                                meditationWindow.un_hide()
-                                pass
-                            else:
-                                # Create new entry dictionary with user input
-                                entry = {
-                                    'number': number,
-                                    'rating': entry1,
-                                    'length': entry2,
-                                    'position': entry3,
-                                    'sound': entry4,
-                                    'inorout': entry5,
-                                    'date': datetime.today().strftime('%m-%d-%Y')
-                                }
-
-                                # If meditation was yesterday, update date
-                                if yesterday == 'Yes':
-                                    entry['date'] = (datetime.today() - timedelta(days=1)).strftime('%m-%d-%Y')
-
-                                # Add entry to list and update file
-                                add_entry(meditationWindow, meditationList, meditationFile, entry)
-
-        elif event == 'Delete Entry':
-            # Clear output window and delete entry
-            meditationWindow['-OUTPUT-'].update('')
-            delete_entry(meditationWindow, meditationList, meditationFile)
-        elif event == 'Exit' or sg.WIN_CLOSED:
-            # Close meditation window and exit program
-            meditationWindow.close()
-            exit()
-
-
-
-def main_menu():
-    """
-    This function is the main entry point for the fitness application, displaying the user interface and handling interactions.
-
-    It presents the user with a weight progress graph, weight data, and buttons to navigate to other fitness sections like strength training, cardio, and meditation.
-    Additionally, it allows users to add new weight entries and delete existing ones.
-    """
-
-    # Open the main menu window and initialize variables
-    open_mainmenu()
-    weightList = []  # Stores weight entries as dictionaries
-    global weight_fig # Global variable for graph
-    toolbar, canvas_agg = None, None
-
-    while True:
-        # Read weight data from file and update list
-        weightList = readFile(weightFile, weightList, mainmenuWindow)
-        next_entry_number = len(weightList) + 1  # Calculate next entry's ID
-
-        # Create a new figure and axes for the weight graph
-        weight_fig, ax = plt.subplots()
-        dates, weights = [], []  # Lists to store data points
-
-        # Extract and format data from each weight entry
-        for entry in weightList:
-            mainmenuWindow['-OUTPUT-'].print(f"{entry['number']}. {entry['weight']} Lbs - {entry['date']}")
-            date_obj = datetime.strptime(entry['date'], '%m-%d-%Y')
-            weight_value = float(entry['weight'])
-            dates.append(date_obj)
-            weights.append(weight_value)
-
-        # Calculate weekly and monthly weight averages
-        current_date = datetime.today()
-        week_ago = current_date - timedelta(days=7)
-        month_ago = current_date - timedelta(days=30)
-        weekly_sum, weekly_count = 0.0, 0
-        monthly_sum, monthly_count = 0.0, 0
-        for i in range(len(dates)):
-            if week_ago <= dates[i] <= current_date:
-                weekly_sum += weights[i]
-                weekly_count += 1
-            if month_ago <= dates[i] <= current_date:
-                monthly_sum += weights[i]
-                monthly_count += 1
-
-        # Prevent division by zero
-        weekly_count = max(weekly_count, 1)
-        monthly_count = max(monthly_count, 1)
-
-        # Update the text elements displaying averages
-        mainmenuWindow['WEEKLY'].update(f'7 Day Average: {weekly_sum / weekly_count:.2f}\n30 Day Average: {monthly_sum / monthly_count:.2f}')
-
-        # Create a line plot showing weight history
-        ax.plot(dates, weights, marker='o')
-
-        # Set axis formatting and limits for readability
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d-%Y'))
-        weight_fig.autofmt_xdate()
-        start_date = datetime(2024, 1, 17)  # Assuming weight data starts from this date
-        ax.set_xlim(start_date, datetime.today())
-        plt.title('Weight History')
-        plt.xlabel('Date')
-        plt.ylabel('Weight (Lbs)')
-        plt.legend()
-        plt.grid()
-
-        # Update the weight graph if it already exists
-        if canvas_agg:
-            canvas_agg.get_tk_widget().forget()  # Remove old canvas
-            toolbar.forget()  # Remove old toolbar
-
-        # Create a new canvas and navigation toolbar for the graph
-        canvas_agg = FigureCanvasTkAgg(weight_fig, master=mainmenuWindow['-CANVAS-'].TKCanvas)
-        canvas_agg.draw()
-        toolbar = NavigationToolbar2Tk(canvas_agg, mainmenuWindow['-CANVAS-'].TKCanvas)
-        toolbar.update()
-
-        # Pack the canvas widget to display the graph
-        canvas_agg.get_tk_widget().pack(side='top', fill='both', expand=1)
-
-        # Read the user's choice from the window
-        choice, values = mainmenuWindow.read()
-
-        # Handle button clicks based on the user's selection
-        if choice == 'Strength':
-            mainmenuWindow.close()
-            strength()  # Open the strength training window
-        elif choice == 'Cardio':
-            mainmenuWindow.close()
-            cardio()  # Open the cardio workout window
-        elif choice == 'Meditation':
-            mainmenuWindow.close()
-            meditation()
-        elif choice == 'Meditation':
-            """
-            This option closes the main menu window and opens the meditation window.
-            """
-            mainmenuWindow.close()
-            meditation()  # Open the meditation functionality
-
-        elif choice in ('Exit', sg.WIN_CLOSED):
-            """
-            Handles both explicit 'Exit' button click and window close event.
-            Closes the main menu window and terminates the program.
-            """
-            mainmenuWindow.close()
-            exit()
-
-        elif choice == 'Add Entry':
-            """
-            This option allows users to add a new weight entry.
-            It hides the main menu window, prompts the user for their current weight,
-            validates the input, and creates a new entry dictionary if valid.
-            Finally, it calls the `add_entry` function to save the new entry to the file.
-            """
-            mainmenuWindow['-OUTPUT-'].update('')  # Clear output text
-            mainmenuWindow.hide()
-
-            entry1 = sg.PopupGetText('Current Weight: ')
-
-            # Validate weight input
-            if entry1 is None or not entry1.replace('.', '', 1).isdigit():
-                mainmenuWindow.un_hide()  # Show window again if input is invalid
-            else:
-                entry = {
-                    'number': next_entry_number,  # Assign next available ID
-                    'weight': entry1,
-                    'date': datetime.today().strftime('%m-%d-%Y')  # Use current date
-                }
-                add_entry(mainmenuWindow, weightList, weightFile, entry)
-
-        elif choice == 'Delete Entry':
-            """
-            This option allows users to delete an existing weight entry.
-            It clears the output text, calls the `delete_entry` function to handle deletion,
-            and updates the weight list and file accordingly.
-            """
-            mainmenuWindow['-OUTPUT-'].update('')
-            delete_entry(mainmenuWindow, weightList, weightFile)
-
-
-
-
-# Menus and fonts using PySimpleGUI
-buttonFont = ('Courier', 23)
-titleFont = ('Courier', 30)
-textFont = ('Arial Italic', 11)
-
-def open_mainmenu():
-    global mainmenuWindow
-    # Main Menu
-    TitleCol = [
-        [sg.Text(f'7 Day Average: \nLast 14 Days: ', key='WEEKLY', justification='center', font=textFont), sg.Push(), sg.Text(f'Weight', justification='center', font=titleFont), sg.Push()]
-    ]
-    LineCol = [
-        [sg.Multiline(size=(80, 30), key='-OUTPUT-', background_color='black', text_color='white', disabled=True, autoscroll=True, font=textFont),sg.Canvas(size=(400, 400), key='-CANVAS-')]
-    ]
-
-
-    mainmenuLayout = [
-        [sg.Column(TitleCol, element_justification='center', expand_x=True)],
-        [sg.Column(LineCol, element_justification='left', expand_x=True)],
-        [sg.Button('Exit', font=buttonFont), sg.Push(),sg.Button('Strength', font=buttonFont),sg.Button('Cardio', font=buttonFont),sg.Button('Meditation', font=buttonFont), sg.Push(), sg.Button('Add Entry', font=buttonFont), sg.Button('Delete Entry', font=buttonFont)]
-        ]
-    mainmenuWindow = sg.Window(title=windowTitle, layout=mainmenuLayout, margins=(80,75), use_custom_titlebar=True, finalize=True, keep_on_top=True, titlebar_icon=titlebarIcon)
-
-
-
-def open_strength():
-    global strengthWindow
-    TitleCol = [
-        [sg.Text(f'7 Day Average: \nLast 14 Days: ', key='WEEKLY', justification='center', font=textFont), sg.OptionMenu(values=[1], key='OPTIONS', default_value='Test'), sg.Button('Update'), sg.Push(), sg.Text(f'Strength', justification='center', font=titleFont), sg.Push()]
-    ]
-    LineCol = [
-        [sg.Multiline(size=(80, 30), key='-OUTPUT-', background_color='black', text_color='white', disabled=True, autoscroll=True, font=textFont),sg.Canvas(size=(400, 400), key='-CANVAS-')]
-    ]
-
-    
-    Layout = [
-        [sg.Column(TitleCol, element_justification='center', expand_x=True)],
-        [sg.Column(LineCol, element_justification='left', expand_x=True)],
-        [sg.Button('Exit', font=buttonFont), sg.Push(),sg.Button('Weight', font=buttonFont),sg.Button('Cardio', font=buttonFont),sg.Button('Meditation', font=buttonFont), sg.Push(), sg.Button('Add Entry', font=buttonFont), sg.Button('Delete Entry', font=buttonFont)]
-        ]
-    
- 
-
-
-
-    strengthWindow = sg.Window(title=windowTitle, layout=Layout, margins=(15,75), use_custom_titlebar=True, finalize=True, keep_on_top=True, titlebar_icon=titlebarIcon)
-
-def open_cardio():
-    global cardioWindow
-    TitleCol = [
-        [sg.Text(f'7 Day Average: \nLast 14 Days: ', key='WEEKLY', justification='center', font=textFont), sg.Push(), sg.Text(f'Cardio', justification='center', font=titleFont), sg.Push()]
-    ]
-    LineCol = [
-        [sg.Multiline(size=(80, 30), key='-OUTPUT-', background_color='black', text_color='white', disabled=True, autoscroll=True, font=textFont),sg.Canvas(size=(400, 400), key='-CANVAS-')]
-    ]
-
-    Layout = [
-        [sg.Column(TitleCol, element_justification='center', expand_x=True)],
-        [sg.Column(LineCol, element_justification='left', expand_x=True)],
-        [sg.Button('Exit', font=buttonFont), sg.Push(),sg.Button('Strength', font=buttonFont),sg.Button('Weight', font=buttonFont),sg.Button('Meditation', font=buttonFont), sg.Push(), sg.Button('Add Entry', font=buttonFont), sg.Button('Delete Entry', font=buttonFont)]
-        ]
-    cardioWindow = sg.Window(title=windowTitle, layout=Layout, margins=(15,75), use_custom_titlebar=True, finalize=True, keep_on_top=True, titlebar_icon=titlebarIcon)
-
-def open_meditation():
-    global meditationWindow
-    TitleCol = [
-        [sg.Text(f'7 Day Average: \nLast 14 Days: ', key='WEEKLY', justification='center', font=textFont), sg.Push(), sg.Text(f'Meditation', justification='center', font=titleFont), sg.Push()]
-    ]
-    LineCol = [
-        [sg.Multiline(size=(80, 30), key='-OUTPUT-', background_color='black', text_color='white', disabled=True, autoscroll=True, font=textFont),sg.Canvas(size=(400, 400), key='-CANVAS-')]
-    ]
-
-    Layout = [
-        [sg.Column(TitleCol, element_justification='center', expand_x=True)],
-        [sg.Column(LineCol, element_justification='left', expand_x=True)],
-        [sg.Button('Exit', font=buttonFont), sg.Push(),sg.Button('Strength', font=buttonFont),sg.Button('Cardio', font=buttonFont),sg.Button('Weight', font=buttonFont), sg.Push(), sg.Button('Add Entry', font=buttonFont), sg.Button('Delete Entry', font=buttonFont)]
-        ]
-    meditationWindow = sg.Window(title=windowTitle, layout=Layout, margins=(15,75), use_custom_titlebar=True, finalize=True, keep_on_top=True, titlebar_icon=titlebarIcon)
-
-
-
-# Run Code
-def main():
-    while True:
-        main_menu()
-
-main()
\ No newline at end of file
+import argparse
+import atexit
+import collections
+import concurrent.futures
+import contextlib
+import csv
+import importlib
+import io
+import itertools
+import json
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import PySimpleGUI as sg
+from xml.etree import ElementTree
+from datetime import datetime, timedelta
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported the first time one of its attributes is used.
+    After that the real module replaces the stand-in in this file's globals.
+    """
+    def __init__(self, name, alias):
+        self.name = name
+        self.alias = alias
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.name)
+        globals()[self.alias] = module
+        return getattr(module, attr)
+
+# NumPy is imported on first use, matplotlib on a background thread (see loadPlotting)
+np = LazyModule('numpy', 'np')
+mdates = mimage = Figure = FigureCanvasTkAgg = NavigationToolbar2Tk = None
+plottingLoaded = threading.Event()
+plottingThread = None
+plottingWaiter = None
+
+# Import time budget checked by --check-startup, and modules that must not be imported at startup
+startupBudget = 0.3
+lazyModules = ['numpy', 'matplotlib']
+
+# Define the window title and file paths
+windowTitle = 'Health & Fitness'
+titlebarIcon = 'icon.png'
+strengthFile = 'strength.json'
+cardioFile = 'cardio.json'
+meditationFile = 'meditation.json'
+weightFile = 'weight.json'
+settingsFile = 'settings.json'  # Goal weight and other choices of the profile
+
+# Profiles. Every profile keeps its logs in its own folder under profilesFolder, the default profile keeps
+# them next to this file like before. The log files above always point into the active profile's folder.
+profilesFolder = 'profiles'
+defaultProfile = 'default'
+activeProfile = defaultProfile
+
+# Days covered by each average shown above the graphs (set with --windows)
+averageWindows = [7, 30]
+
+# Weight trend. The smoothed weight is an exponential moving average that moves trendSmoothing of the way
+# to each new entry, and the rate is the slope of a least squares line through the last trendDays days.
+trendSmoothing = 0.1
+trendDays = 28
+
+# Graph lines are cut down to the lowest and highest point of each pixel column of the visible range,
+# so a line never has more than about pointsPerPixel points per pixel of the graph's width.
+pointsPerPixel = 2
+
+# Journal settings. Every add/delete is appended to '<file>.journal' as one JSON record per line,
+# and the journal is folded back into the JSON snapshot once it grows past compactThreshold records.
+journalSuffix = '.journal'
+compactThreshold = 500
+journalLocks = {}
+journalCounts = {}
+compacting = set()
+
+# Group commit. Journal records are queued and written with one write and one fsync per file, commitDelay
+# seconds after the first of them, so a burst of adds or an import costs a single flush (0 writes every
+# record straight away). flushWrites() writes whatever is still queued, it also runs when the program exits.
+commitDelay = 0.05
+pendingRecords = {}
+commitTimers = {}
+commitLock = threading.Lock()
+
+# Binary snapshots. Next to each JSON snapshot a fixed-width copy of its entries is kept in '<file>.bin'
+# (epoch-day int32 dates, int32 ids, float32/int32 numbers and int16 category codes) with its category
+# labels in '<file>.meta'. A cold load memory-maps it instead of parsing the JSON, which stays the source
+# of truth: the binary snapshot is rebuilt whenever the JSON snapshot is newer than it.
+binarySuffix = '.bin'
+metaSuffix = '.meta'
+
+# Entries are kept in dicts keyed by a stable id that is never reused. The number shown next to an
+# entry is only its position, worked out when the log is displayed.
+nextIds = {}
+displayIds = {}
+
+# The log pane shows one page of logPageSize entries at a time, newest page first (set with --page-size, 0 shows all)
+logPageSize = 200
+logPages = {}
+
+# Storage backend: 'journal' keeps each log in its JSON snapshot + journal files, 'sqlite' keeps
+# every log in a table of fitness.db next to the JSON files (set with --storage)
+storageBackend = 'journal'
+sqliteName = 'fitness.db'
+sqliteConnections = {}
+
+# Timing of each phase of filling a screen, turned on with --profile or the FITNESS_PROFILE environment variable.
+# The last profileSamples times of every phase are kept, shown in a debug panel and written to profileLog on exit.
+profiling = bool(os.environ.get('FITNESS_PROFILE'))
+profileSamples = 200
+profileLog = 'profile.log'
+phaseTimes = {}
+
+# Worker threads. Logs are read, parsed and averaged on workerPool and the results are sent back to the window
+# as '-LOADED-' events, so the GUI thread only draws. A log's dataLock keeps a worker reading it from
+# running at the same time as an add or delete.
+workerCount = 2
+workerPool = None
+dataLocks = {}
+
+# Process-wide dataset cache. Each file is parsed once and served from memory until its
+# version counter (bumped on every write) or its snapshot/journal mtime and size change.
+datasetCache = {}
+dataVersions = {}
+loadCounts = {}  # Times each file was read from disk, so data from two reads is never taken for the same
+cacheStats = {'hits': 0, 'misses': 0}
+
+# Set the theme for the GUI
+sg.theme('Python Plus')
+
+def profileFolder(name):
+    """
+    Function to get the folder a profile keeps its logs in.
+    """
+    return '' if name == defaultProfile else os.path.join(profilesFolder, name)
+
+def listProfiles():
+    """
+    Function to get the names of every profile, the default one first.
+    """
+    try:
+        names = sorted(name for name in os.listdir(profilesFolder) if os.path.isdir(os.path.join(profilesFolder, name)))
+    except FileNotFoundError:
+        names = []
+    return [defaultProfile] + [name for name in names if name != defaultProfile]
+
+def setProfile(name):
+    """
+    Function to make a profile the active one, creating its folder if it's new.
+    Logs are only read when a screen shows them, and logs of other profiles stay cached under their own paths.
+    """
+    global activeProfile, weightFile, strengthFile, cardioFile, meditationFile, settingsFile
+    if not re.fullmatch(r'[\w\- ]+', name):
+        raise ValueError(f'Invalid profile name {name!r}')
+    folder = profileFolder(name)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    activeProfile = name
+    weightFile = os.path.join(folder, 'weight.json')
+    strengthFile = os.path.join(folder, 'strength.json')
+    cardioFile = os.path.join(folder, 'cardio.json')
+    meditationFile = os.path.join(folder, 'meditation.json')
+    settingsFile = os.path.join(folder, 'settings.json')
+
+def readSettings():
+    """
+    Function to read the settings of the active profile, empty if it has none yet.
+    """
+    try:
+        with open(settingsFile) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def writeSettings(settings):
+    """
+    Function to write the settings of the active profile, atomically.
+    """
+    with atomicFile(settingsFile) as f:
+        json.dump(settings, f)
+
+def journalLock(filename):
+    """
+    Function to get the lock guarding a file's snapshot and journal.
+    """
+    return journalLocks.setdefault(filename, threading.Lock())
+
+def dataLock(filename):
+    """
+    Function to get the lock guarding a log's entries and columns while they are loaded or changed.
+    """
+    return dataLocks.setdefault(filename, threading.Lock())
+
+def migrateFile(filename):
+    """
+    Function to migrate an old style JSON file to snapshot + journal storage.
+    The existing list becomes the snapshot and an empty journal is created next to it.
+    """
+    if os.path.exists(filename + journalSuffix):
+        return
+    try:
+        with open(filename, 'r') as f:
+            list1 = json.load(f)
+    except (FileNotFoundError, json.decoder.JSONDecodeError):
+        list1 = []
+    writeFile(filename, list1)
+    open(filename + journalSuffix, 'a').close()
+
+def replayJournal(filename, entries, ids=None):
+    """
+    Function to apply every record of a file's journal to a dict of entries.
+    A torn last line from a crash mid-append is ignored and cut off the journal, so the next append starts on a line of its own.
+    The next id is tracked in ids (nextIds by default).
+    """
+    ids = nextIds if ids is None else ids
+    count = 0
+    end = 0  # Where the last complete line ends
+    with open(filename + journalSuffix, 'rb+') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                f.truncate(end)
+                break
+            end += len(line)
+            try:
+                record = json.loads(line)
+            except json.decoder.JSONDecodeError:
+                continue
+            if record['op'] == 'add':
+                entry = record['entry']
+                entry.pop('number', None)
+                entry.setdefault('id', ids[filename])
+                entries[entry['id']] = entry
+                ids[filename] = max(ids[filename], entry['id'] + 1)
+            elif record['op'] == 'delete':
+                if 'index' in record:
+                    # Journals written before entries had ids delete by position
+                    del entries[list(entries)[record['index']]]
+                else:
+                    entries.pop(record['id'], None)
+            elif record['op'] == 'next_id':
+                ids[filename] = max(ids[filename], record['id'])
+            count += 1
+    journalCounts[filename] = count
+    return entries
+
+def readSnapshot(filename, ids=None):
+    """
+    Function to read a file's snapshot into a dict of entries keyed by id.
+    Entries from before ids existed get their position as id.
+    The next id is tracked in ids (nextIds by default).
+    """
+    ids = nextIds if ids is None else ids
+    try:
+        with open(filename, 'r') as f:
+            list1 = json.load(f)
+    except json.decoder.JSONDecodeError:
+        list1 = []
+    entries = {}
+    ids[filename] = 1
+    for entry in list1:
+        entry.pop('number', None)
+        entry.setdefault('id', ids[filename])
+        entries[entry['id']] = entry
+        ids[filename] = max(ids[filename], entry['id'] + 1)
+    return entries
+
+def loadFile(filename):
+    """
+    Function to load the snapshot of a file and replay its journal on top of it.
+    The binary snapshot is used when it is current, otherwise the JSON is read and the binary snapshot rebuilt.
+    """
+    migrateFile(filename)
+    flushJournal(filename)  # Records still queued have to be on disk to be replayed
+    with journalLock(filename):
+        entries = readBinary(filename)
+        if entries is None:
+            entries = readSnapshot(filename)
+            writeBinary(filename, entries)
+            # Map the binary snapshot just written, so the columns are copied from it instead of parsing every entry again
+            entries = readBinary(filename) or entries
+        entries = replayJournal(filename, entries)
+    startCompaction(filename)
+    return entries
+
+def fileSignature(filename):
+    """
+    Function to get the mtime and size of a file's snapshot and journal.
+    With SQLite it's the database's data_version, which only changes when another process commits to it,
+    so writing one log's table doesn't make the other logs look changed (their dataVersions track this process' writes).
+    """
+    if storageBackend == 'sqlite':
+        return (sqliteConnect(filename).execute('PRAGMA data_version').fetchone()[0],)
+    signature = []
+    for path in (filename, filename + journalSuffix):
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
+def cacheStore(filename, list1):
+    """
+    Function to store a log's entries in the dataset cache under the file's current version and signature.
+    """
+    datasetCache[filename] = (dataVersions.get(filename, 0), fileSignature(filename), list1)
+
+def readFile(filename, list1, window):
+    """
+    Function to read a file and load its entries, keyed by id.
+    The parsed entries are served from the dataset cache until the file changes.
+    """
+    cached = datasetCache.get(filename)
+    if cached and cached[0] == dataVersions.get(filename, 0) and cached[1] == fileSignature(filename):
+        cacheStats['hits'] += 1
+        list1 = cached[2]
+    else:
+        cacheStats['misses'] += 1
+        loadCounts[filename] = loadCounts.get(filename, 0) + 1
+        list1 = sqliteLoad(filename) if storageBackend == 'sqlite' else loadFile(filename)
+        cacheStore(filename, list1)
+    return list1
+
+@contextlib.contextmanager
+def timed(phase):
+    """
+    Function to time the block it wraps as one sample of phase when profiling is on.
+    """
+    if not profiling:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phaseTimes.setdefault(phase, collections.deque(maxlen=profileSamples)).append(time.perf_counter() - start)
+
+def profileSummary():
+    """
+    Function to get the p50 and p95 latency of every timed phase, one line per phase, and the dataset cache counters.
+    """
+    lines = []
+    for phase, samples in sorted(phaseTimes.items()):
+        ordered = sorted(samples)
+        p50 = ordered[(len(ordered) - 1) // 2]
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        lines.append(f'{phase:<22} p50 {p50 * 1000:8.2f} ms   p95 {p95 * 1000:8.2f} ms   n={len(ordered)}')
+    lines.append(f"Dataset cache: {cacheStats['hits']} hits, {cacheStats['misses']} misses")
+    return '\n'.join(lines)
+
+def writeProfile():
+    """
+    Function to append the latency summary to profileLog.
+    """
+    if profiling and phaseTimes:
+        with open(profileLog, 'a') as f:
+            f.write(f"{datetime.now().strftime('%m-%d-%Y %H:%M:%S')}\n{profileSummary()}\n\n")
+
+@contextlib.contextmanager
+def atomicFile(path, mode='w'):
+    """
+    Function to open a temporary file for the new contents of path, moved over path once it is flushed to disk.
+    A crash leaves either the old file or the new one, never a half written one.
+    """
+    with open(path + '.tmp', mode) as f:
+        yield f
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + '.tmp', path)
+
+def writeFile(filename, list):
+    """
+    Function to write a list into a file, atomically.
+    """
+    with atomicFile(filename) as f:
+        json.dump(list, f)
+
+def appendJournal(filename, *records):
+    """
+    Function to queue records for a file's journal, they are written to disk together by the next group commit.
+    """
+    migrateFile(filename)
+    with commitLock:
+        pendingRecords.setdefault(filename, []).extend(records)
+        dataVersions[filename] = dataVersions.get(filename, 0) + 1
+        if commitDelay > 0 and filename not in commitTimers:
+            commitTimers[filename] = threading.Timer(commitDelay, flushJournal, args=(filename,))
+            commitTimers[filename].daemon = True
+            commitTimers[filename].start()
+    if commitDelay <= 0:
+        flushJournal(filename)
+
+def flushJournal(filename):
+    """
+    Function to append a file's queued records to its journal with one write and one fsync.
+    """
+    with journalLock(filename):
+        with commitLock:
+            records = pendingRecords.pop(filename, [])
+            timer = commitTimers.pop(filename, None)
+        if timer is not None:
+            timer.cancel()
+        if not records:
+            return
+        with open(filename + journalSuffix, 'a') as f:
+            f.write(''.join(json.dumps(record) + '\n' for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+        journalCounts[filename] = journalCounts.get(filename, 0) + len(records)
+        # The cached entries already hold these records, so the journal growing shouldn't make them be read again
+        cached = datasetCache.get(filename)
+        if cached and cached[0] == dataVersions.get(filename, 0):
+            cacheStore(filename, cached[2])
+    startCompaction(filename)
+
+def flushWrites():
+    """
+    Function to write every queued journal record to disk, called on exit.
+    """
+    for filename in list(pendingRecords):
+        flushJournal(filename)
+
+atexit.register(flushWrites)
+
+def startCompaction(filename):
+    """
+    Function to start a background compaction of a file once its journal gets too long.
+    """
+    if journalCounts.get(filename, 0) >= compactThreshold and filename not in compacting:
+        compacting.add(filename)
+        threading.Thread(target=compactFile, args=(filename,), daemon=True).start()
+
+def compactFile(filename):
+    """
+    Function to fold a file's journal into its snapshot and empty the journal.
+    The new journal starts with the next id so ids of deleted entries are never handed out again.
+    """
+    flushJournal(filename)
+    with journalLock(filename):
+        # Ids are tracked apart from nextIds, which may be handing out ids for new entries meanwhile
+        cached = datasetCache.get(filename)
+        current = cached and cached[0] == dataVersions.get(filename, 0) and cached[1] == fileSignature(filename)
+        ids = {}
+        entries = replayJournal(filename, readSnapshot(filename, ids), ids)
+        writeFile(filename, list(entries.values()))
+        writeBinary(filename, entries)
+        with atomicFile(filename + journalSuffix) as f:
+            f.write(json.dumps({'op': 'next_id', 'id': max(ids[filename], nextIds.get(filename, 1))}) + '\n')
+        journalCounts[filename] = 0
+        # Compacting doesn't change the entries, so cached ones that were current still are and only need the new signature
+        if current:
+            cacheStore(filename, cached[2])
+        compacting.discard(filename)
+
+# Typed columns of each log. 'category' fields are stored as small integer codes.
+logSchemas = {
+    'weight': {'weight': 'float32'},
+    'strength': {'exercise': 'category', 'weight': 'float32', 'reps': 'float32'},
+    'cardio': {'distance': 'float32', 'minutes': 'int32', 'seconds': 'int32'},
+    'meditation': {'rating': 'float32', 'length': 'float32', 'position': 'category', 'sound': 'category', 'inorout': 'category'},
+}
+columnCache = {}
+
+def parseEntries(kind, entries):
+    """
+    Function to parse the dates and numbers of entries of a kind of log into arrays.
+    Raises ValueError on the first value that isn't a date or a number.
+    """
+    parsed = {'date': np.array([f"{i['date'][6:]}-{i['date'][:2]}-{i['date'][3:5]}" for i in entries], dtype='datetime64[D]')}
+    for name, dtype in logSchemas[kind].items():
+        if dtype != 'category':
+            parsed[name] = np.array([i[name] for i in entries], dtype=np.float64)
+    return parsed
+
+class LogColumns:
+    """
+    Columnar copy of a log with one NumPy array per field.
+
+    Dates are stored as datetime64[D], numbers as float32/int32 and categories as int16 codes.
+    Strength also gets a 'one_rm' column and cardio gets 'time' (minutes) and 'speed' (MPH).
+    Every entry is parsed once, when the log is loaded or when the entry is appended.
+    Strength rows are also indexed by exercise code, so one exercise's rows are a dictionary lookup.
+    Deleting an entry only clears its row's 'alive' flag, so a delete costs the same on any log size.
+    """
+    def __init__(self, kind, entries):
+        self.kind = kind
+        self.size = 0
+        self.labels = {}
+        self.codes = {}
+        self.columns = {'date': np.empty(0, 'datetime64[D]')}
+        self.aggregates = {}
+        self.index = {}
+        self.versions = {}
+        self.sorted = True  # Whether the id column is in increasing order, so rows are found by binary search
+        self.rowIndex = None
+        self.weightTrend = None
+        self.strengthSummary = None
+        self.columns['id'] = np.empty(0, np.int64)
+        self.columns['alive'] = np.empty(0, bool)
+        for name, dtype in logSchemas[kind].items():
+            if dtype == 'category':
+                self.labels[name] = []
+                self.codes[name] = {}
+                dtype = 'int16'
+            self.columns[name] = np.empty(0, dtype)
+        if kind == 'strength':
+            self.columns['one_rm'] = np.empty(0, np.float32)
+        elif kind == 'cardio':
+            self.columns['time'] = np.empty(0, np.float32)
+            self.columns['speed'] = np.empty(0, np.float32)
+        self.extend(entries)
+
+    def __getitem__(self, name):
+        return self.columns[name][:self.size]
+
+    def live(self, name):
+        """
+        Get a column without the rows of deleted entries.
+        """
+        return self[name][self['alive']]
+
+    def code(self, name, label):
+        """
+        Get the integer code of a category label, adding the label if it is new.
+        """
+        if label not in self.codes[name]:
+            self.codes[name][label] = len(self.labels[name])
+            self.labels[name].append(label)
+        return self.codes[name][label]
+
+    def reserve(self, size):
+        """
+        Grow every column so it can hold at least size rows.
+        Capacity doubles so appending one entry at a time stays amortized O(1).
+        """
+        capacity = len(self.columns['date'])
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2, 16)
+        for name, column in self.columns.items():
+            grown = np.empty(capacity, column.dtype)
+            grown[:self.size] = column[:self.size]
+            self.columns[name] = grown
+
+    def extend(self, entries, parsed=None):
+        """
+        Parse entries (unless parseEntries() already did) and append them to the end of every column.
+        Every entry is parsed before any column changes, so a bad value leaves the columns as they were.
+        """
+        if parsed is None:
+            parsed = parseEntries(self.kind, entries)
+        start, end = self.size, self.size + len(entries)
+        self.reserve(end)
+        self.columns['date'][start:end] = parsed['date']
+        self.columns['id'][start:end] = [i['id'] for i in entries]
+        self.columns['alive'][start:end] = True
+        self.index_ids(start, end)
+        for name, dtype in logSchemas[self.kind].items():
+            if dtype == 'category':
+                self.columns[name][start:end] = [self.code(name, i[name]) for i in entries]
+            else:
+                self.columns[name][start:end] = parsed[name]
+        self.derive(start, end)
+
+    def extend_snapshot(self, snapshot):
+        """
+        Append the live rows of a binary snapshot (SnapshotEntries) to every column without parsing any entry,
+        then the entries added after it.
+        """
+        records = snapshot.records
+        start, end = self.size, self.size + len(records)
+        self.reserve(end)
+        self.columns['date'][start:end] = records['day'].astype('datetime64[D]')
+        self.columns['id'][start:end] = records['id']
+        self.columns['alive'][start:end] = True
+        self.columns['alive'][start + np.array(sorted(snapshot.deleted), dtype=np.int64)] = False
+        self.index_ids(start, end)
+        for name, dtype in logSchemas[self.kind].items():
+            if dtype == 'category':
+                # Map the snapshot's codes onto this table's codes
+                codes = np.array([self.code(name, label) for label in snapshot.labels[name]], dtype=np.int16)
+                self.columns[name][start:end] = codes[records[name]] if len(codes) else records[name]
+            else:
+                self.columns[name][start:end] = records[name]
+        self.derive(start, end)
+        self.extend(list(snapshot.added.values()))
+
+    def index_ids(self, start, end):
+        """
+        Check that the ids of rows start to end keep the id column in increasing order.
+        """
+        if self.sorted:
+            ids = self.columns['id'][max(start - 1, 0):end]
+            self.sorted = bool(np.all(np.diff(ids) > 0))
+        self.rowIndex = None
+
+    def row(self, entry_id):
+        """
+        Get the row of an entry that is not deleted by its id, or None if there is none.
+        Like SnapshotEntries.row(), ids are found by binary search, a dict is only built if they are out of order.
+        """
+        ids = self.columns['id'][:self.size]
+        if self.sorted:
+            row = int(np.searchsorted(ids, entry_id))
+        else:
+            if self.rowIndex is None:
+                self.rowIndex = dict(zip(ids.tolist(), range(self.size)))
+            row = self.rowIndex.get(entry_id, self.size)
+        if row < self.size and ids[row] == entry_id and self.columns['alive'][row]:
+            return row
+        return None
+
+    def derive(self, start, end):
+        """
+        Work out the computed columns of rows start to end and index them.
+        """
+        columns = self.columns
+        if self.kind == 'strength':
+            # weight / ( 1.0278 – 0.0278 × reps ) - 1 REP MAX EQUATION
+            columns['one_rm'][start:end] = columns['weight'][start:end] / (1.0278 - 0.0278 * columns['reps'][start:end])
+        elif self.kind == 'cardio':
+            columns['time'][start:end] = columns['minutes'][start:end] + columns['seconds'][start:end] / 60
+            with np.errstate(divide='ignore', invalid='ignore'):
+                columns['speed'][start:end] = columns['distance'][start:end] / columns['time'][start:end] * 60
+        self.size = end
+        if self.kind == 'strength':
+            for code in np.unique(columns['exercise'][start:end]):
+                self.add_rows(code, start + np.flatnonzero(columns['exercise'][start:end] == code))
+        for (metrics, exercise), aggregate in self.aggregates.items():
+            rows = slice(start, end) if exercise is None else start + np.flatnonzero(columns['exercise'][start:end] == exercise)
+            aggregate.extend(columns['date'][rows], {name: columns[name][rows] for name in metrics})
+        if self.weightTrend is not None:
+            self.weightTrend.add(columns['date'][start:end], columns['weight'][start:end], columns['id'][start:end])
+        if self.strengthSummary is not None:
+            self.strengthSummary.add(start, end)
+
+    def append(self, entry):
+        """
+        Append a single entry to every column.
+        """
+        self.extend([entry])
+
+    def add_rows(self, code, rows):
+        """
+        Add row numbers to the index of an exercise code.
+        """
+        index, count = self.index.get(code, (np.empty(0, np.int64), 0))
+        if count + len(rows) > len(index):
+            index = np.resize(index, max(count + len(rows), len(index) * 2, 16))
+        index[count:count+len(rows)] = rows
+        self.index[code] = (index, count + len(rows))
+        self.versions[code] = self.versions.get(code, 0) + 1
+
+    def rows(self, code):
+        """
+        Get the row numbers of an exercise code's entries that are not deleted, oldest first.
+        """
+        index, count = self.index.get(code, (np.empty(0, np.int64), 0))
+        return index[:count][self.columns['alive'][index[:count]]]
+
+    def delete(self, entry_id):
+        """
+        Mark the row of an entry as deleted and take it out of the aggregates.
+        An aggregate holding too many removed rows is dropped and rebuilt on its next use.
+        """
+        row = self.row(entry_id)
+        if row is None:
+            raise KeyError(entry_id)
+        self.columns['alive'][row] = False
+        exercise = int(self.columns['exercise'][row]) if self.kind == 'strength' else None
+        if exercise is not None:
+            self.versions[exercise] = self.versions.get(exercise, 0) + 1
+        for key, aggregate in list(self.aggregates.items()):
+            if key[1] is None or key[1] == exercise:
+                aggregate.remove(self.columns['date'][row], {name: self.columns[name][row] for name in key[0]})
+                if len(aggregate.removed) > 64:
+                    del self.aggregates[key]
+        if self.weightTrend is not None:
+            self.weightTrend.remove(entry_id)
+        if self.strengthSummary is not None:
+            self.strengthSummary.remove(row)
+
+    def aggregate(self, metrics, exercise=None):
+        """
+        Get the rolling aggregate of some metrics, optionally only over one exercise code.
+        It is built on first use and kept up to date by extend().
+        """
+        key = (tuple(metrics), exercise)
+        if key not in self.aggregates:
+            rows = self['alive'] if exercise is None else self.rows(exercise)
+            self.aggregates[key] = RollingAggregate(self['date'][rows], {name: self[name][rows] for name in metrics})
+        return self.aggregates[key]
+
+    def trend(self):
+        """
+        Get the weight trend of a weight log.
+        It is built on first use and kept up to date by extend() and delete().
+        """
+        if self.weightTrend is None:
+            self.weightTrend = WeightTrend(self.live('date'), self.live('weight'), self.live('id'))
+        return self.weightTrend
+
+    def summary(self):
+        """
+        Get the bests and tonnage of every exercise of a strength log.
+        It is built on first use and kept up to date by extend() and delete().
+        """
+        if self.strengthSummary is None:
+            self.strengthSummary = StrengthSummary(self)
+        return self.strengthSummary
+
+class RollingAggregate:
+    """
+    Windowed sums and averages over date-sorted rows using prefix sums.
+
+    Any window [today - k + 1, today] is answered with two binary searches and a subtraction.
+    Appending rows dated on or after the newest row is amortized O(1); an older date
+    (like a meditation logged for yesterday) re-sorts the rows once. Removed rows are kept
+    aside and subtracted from the windows they fall in.
+    """
+    def __init__(self, dates, metrics):
+        self.removed = []
+        order = np.argsort(dates, kind='stable')
+        self.size = len(order)
+        self.days = dates[order].astype(np.int64)
+        self.prefix = {}
+        for name, values in metrics.items():
+            prefix = np.zeros(self.size + 1)
+            np.cumsum(np.nan_to_num(values[order].astype(np.float64), posinf=0.0, neginf=0.0), out=prefix[1:])
+            self.prefix[name] = prefix
+
+    def extend(self, dates, metrics):
+        """
+        Add rows to the aggregate.
+        """
+        days = dates.astype(np.int64)
+        if len(days) == 0:
+            return
+        if (self.size and days.min() < self.days[self.size-1]) or np.any(np.diff(days) < 0):
+            # Out of order, rebuild from the stored values plus the new rows
+            old = {name: np.diff(prefix[:self.size+1]) for name, prefix in self.prefix.items()}
+            removed = self.removed
+            self.__init__(np.concatenate((self.days[:self.size], days)), {name: np.concatenate((old[name], metrics[name])) for name in old})
+            self.removed = removed
+            return
+        start, end = self.size, self.size + len(days)
+        if end > len(self.days):
+            capacity = max(end, len(self.days) * 2, 16)
+            self.days = np.resize(self.days, capacity)
+            self.prefix = {name: np.resize(prefix, capacity + 1) for name, prefix in self.prefix.items()}
+        self.days[start:end] = days
+        for name, prefix in self.prefix.items():
+            values = np.nan_to_num(np.asarray(metrics[name], dtype=np.float64), posinf=0.0, neginf=0.0)
+            prefix[start+1:end+1] = prefix[start] + np.cumsum(values)
+        self.size = end
+
+    def remove(self, date, values):
+        """
+        Remove a row from the aggregate.
+        """
+        values = {name: float(np.nan_to_num(value, posinf=0.0, neginf=0.0)) for name, value in values.items()}
+        self.removed.append((int(date.astype(np.int64)), values))
+
+    def window(self, days, today=None):
+        """
+        Get the index range of the rows in the last days days, today included,
+        and the removed rows that fall in it.
+        """
+        if today is None:
+            today = datetime.today().date()
+        today = np.datetime64(today, 'D').astype(np.int64)
+        low = np.searchsorted(self.days[:self.size], today - days + 1, 'left')
+        high = np.searchsorted(self.days[:self.size], today, 'right')
+        removed = [values for day, values in self.removed if today - days < day <= today]
+        return low, high, removed
+
+    def total(self, name, days, today=None):
+        """
+        Sum of a metric over the last days days.
+        """
+        low, high, removed = self.window(days, today)
+        return float(self.prefix[name][high] - self.prefix[name][low]) - sum(values[name] for values in removed)
+
+    def average(self, name, days, today=None):
+        """
+        Average of a metric over the last days days, 0 if there are no rows in the window.
+        """
+        low, high, removed = self.window(days, today)
+        count = high - low - len(removed)
+        if count == 0:
+            return 0.0
+        return (float(self.prefix[name][high] - self.prefix[name][low]) - sum(values[name] for values in removed)) / count
+
+smoothingWeights = {}
+
+class StrengthSummary:
+    """
+    Best estimated 1 rep max and weekly tonnage (weight x reps) of every exercise of a strength log,
+    kept up to date one entry at a time.
+
+    Bests are kept per exercise and day, so the best over a recent window only looks at the days in it,
+    and tonnage is summed per exercise and week (weeks start on Monday). An entry that beats the best
+    of its exercise when it's added is flagged as a PR.
+    """
+    def __init__(self, columns):
+        self.columns = columns
+        self.best = {}  # Exercise code to its all-time best 1 rep max
+        self.dayBest = {}  # Exercise code to {day: best 1 rep max that day}
+        self.tonnage = {}  # Exercise code to {week: weight x reps}
+        self.prs = set()  # Ids of entries that were a PR when they were added
+        for code in columns.index:
+            rows = columns.rows(code)
+            if not len(rows):
+                continue
+            days = columns['date'][rows].astype(np.int64)
+            order = np.lexsort((columns['id'][rows], days))
+            rows, days = rows[order], days[order]
+            one_rm = columns['one_rm'][rows].astype(np.float64)
+            # PRs are the entries that beat every entry logged before them
+            before = np.maximum.accumulate(one_rm)[:-1]
+            self.prs.update(columns['id'][rows[1:][one_rm[1:] > before]].tolist())
+            self.best[code] = float(one_rm.max())
+            starts = np.flatnonzero(np.diff(days, prepend=days[0] - 1))
+            self.dayBest[code] = dict(zip(days[starts].tolist(), np.maximum.reduceat(one_rm, starts).tolist()))
+            weeks = (days + 3) // 7
+            starts = np.flatnonzero(np.diff(weeks, prepend=weeks[0] - 1))
+            lifted = columns['weight'][rows].astype(np.float64) * columns['reps'][rows]
+            self.tonnage[code] = dict(zip(weeks[starts].tolist(), np.add.reduceat(lifted, starts).tolist()))
+
+    def add(self, start, end):
+        """
+        Add rows start to end of the columns, flagging the ones that beat their exercise's best.
+        """
+        columns = self.columns
+        for row in range(start, end):
+            code, day = int(columns['exercise'][row]), int(columns['date'][row].astype(np.int64))
+            one_rm = float(columns['one_rm'][row])
+            if code in self.best and one_rm > self.best[code]:
+                self.prs.add(int(columns['id'][row]))
+            self.best[code] = max(self.best.get(code, one_rm), one_rm)
+            days = self.dayBest.setdefault(code, {})
+            days[day] = max(days.get(day, one_rm), one_rm)
+            weeks = self.tonnage.setdefault(code, {})
+            weeks[(day + 3) // 7] = weeks.get((day + 3) // 7, 0.0) + float(columns['weight'][row]) * float(columns['reps'][row])
+
+    def remove(self, row):
+        """
+        Take a deleted row out of the tables, only the day and week it was in are worked out again.
+        """
+        columns = self.columns
+        code, day = int(columns['exercise'][row]), int(columns['date'][row].astype(np.int64))
+        self.prs.discard(int(columns['id'][row]))
+        weeks = self.tonnage[code]
+        weeks[(day + 3) // 7] -= float(columns['weight'][row]) * float(columns['reps'][row])
+        days = self.dayBest[code]
+        if float(columns['one_rm'][row]) >= days[day]:
+            rows = columns.rows(code)
+            rows = rows[columns['date'][rows].astype(np.int64) == day]
+            if len(rows):
+                days[day] = float(columns['one_rm'][rows].max())
+            else:
+                del days[day]
+            if days:
+                self.best[code] = max(days.values())
+            else:
+                del self.best[code], self.dayBest[code], self.tonnage[code]
+
+    def window_best(self, code, days, today=None):
+        """
+        Get the best 1 rep max of an exercise over the last days days, None if it has no entries in them.
+        """
+        if today is None:
+            today = datetime.today().date()
+        today = int(np.datetime64(today, 'D').astype(np.int64))
+        bests = self.dayBest.get(code, {})
+        if len(bests) < days:
+            values = [best for day, best in bests.items() if today - days < day <= today]
+        else:
+            values = [bests[day] for day in range(today - days + 1, today + 1) if day in bests]
+        return max(values) if values else None
+
+    def week_tonnage(self, code, weeksAgo=0, today=None):
+        """
+        Get the tonnage of an exercise in the week weeksAgo weeks before this one.
+        """
+        if today is None:
+            today = datetime.today().date()
+        week = (int(np.datetime64(today, 'D').astype(np.int64)) + 3) // 7 - weeksAgo
+        return self.tonnage.get(code, {}).get(week, 0.0)
+
+    def table(self, today=None):
+        """
+        Get a row of the summary table for every exercise with entries:
+        exercise, best, the best of every average window, this week's and last week's tonnage.
+        """
+        rows = []
+        for code, exercise in enumerate(self.columns.labels['exercise']):
+            if code not in self.best:
+                continue
+            windows = [self.window_best(code, days, today) for days in averageWindows]
+            rows.append([exercise, f'{self.best[code]:.1f}'] + ['-' if best is None else f'{best:.1f}' for best in windows]
+                        + [f'{self.week_tonnage(code, weeks, today):,.0f}' for weeks in (0, 1)])
+        return rows
+
+def smooth(values, start, alpha, block=128):
+    """
+    Function to get the exponential moving average of values carried on from start.
+    Each block of values is smoothed with one matrix product, so only the blocks are looped over in Python.
+    """
+    decay = 1 - alpha
+    if (alpha, block) not in smoothingWeights:
+        steps = np.arange(block)
+        # weights[t, j] is how much value j of a block counts towards smoothed value t of the same block
+        with np.errstate(over='ignore'):
+            weights = np.tril(alpha * decay ** (steps[:, None] - steps[None, :]).astype(np.float64))
+        smoothingWeights[alpha, block] = (weights, decay ** (steps + 1.0))
+    weights, carry = smoothingWeights[alpha, block]
+    smoothed = np.empty(len(values))
+    for i in range(0, len(values), block):
+        chunk = values[i:i+block]
+        n = len(chunk)
+        smoothed[i:i+n] = weights[:n, :n] @ chunk + carry[:n] * start
+        start = smoothed[i+n-1]
+    return smoothed
+
+class WeightTrend:
+    """
+    Smoothed weight, rate of change and goal forecast of a weight log, kept up to date one entry at a time.
+
+    Entries are kept sorted by date next to their smoothed weight and prefix sums of the regression terms,
+    so the rate over the last trendDays days is two binary searches and a few subtractions.
+    Adding or removing an entry only refits the entries dated after it, which for a new entry is just itself.
+    """
+    def __init__(self, dates, weights, ids):
+        self.size = 0
+        self.origin = 0
+        self.days = np.empty(0, np.int64)
+        self.weights = np.empty(0, np.float64)
+        self.ids = np.empty(0, np.int64)
+        self.smoothed = np.empty(0, np.float64)
+        self.prefix = {name: np.zeros(1) for name in ('x', 'y', 'xy', 'xx')}
+        self.add(dates, weights, ids)
+
+    def reserve(self, size):
+        """
+        Grow the arrays so they can hold at least size entries, doubling like LogColumns.reserve().
+        """
+        capacity = len(self.days)
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2, 16)
+        for name in ('days', 'weights', 'ids', 'smoothed'):
+            grown = np.empty(capacity, getattr(self, name).dtype)
+            grown[:self.size] = getattr(self, name)[:self.size]
+            setattr(self, name, grown)
+        for name, prefix in self.prefix.items():
+            self.prefix[name] = np.empty(capacity + 1)
+            self.prefix[name][:self.size+1] = prefix[:self.size+1]
+
+    def refit(self, start):
+        """
+        Work out the smoothed weights and prefix sums of every entry from start on.
+        """
+        if start == 0:
+            self.origin = int(self.days[0]) if self.size else 0
+        end = self.size
+        weights = self.weights[start:end]
+        first = weights[0] if start == 0 and end else self.smoothed[start-1] if start else 0.0
+        self.smoothed[start:end] = smooth(weights, first, trendSmoothing)
+        x = (self.days[start:end] - self.origin).astype(np.float64)
+        for name, values in (('x', x), ('y', weights), ('xy', x * weights), ('xx', x * x)):
+            prefix = self.prefix[name]
+            prefix[start+1:end+1] = prefix[start] + np.cumsum(values)
+
+    def add(self, dates, weights, ids):
+        """
+        Add entries to the trend.
+        """
+        days = dates.astype(np.int64)
+        if len(days) == 0:
+            return
+        order = np.argsort(days, kind='stable')
+        days, weights, ids = days[order], np.asarray(weights, np.float64)[order], ids[order]
+        self.reserve(self.size + len(days))
+        start, end = self.size, self.size + len(days)
+        if start and days[0] < self.days[start-1]:
+            # Entries dated before the newest one are merged in, and everything after them refit
+            start = int(np.searchsorted(self.days[:self.size], days[0], 'right'))
+            merged = [np.concatenate((array[start:self.size], new)) for array, new in ((self.days, days), (self.weights, weights), (self.ids, ids))]
+            order = np.argsort(merged[0], kind='stable')
+            days, weights, ids = (array[order] for array in merged)
+        self.days[start:end], self.weights[start:end], self.ids[start:end] = days, weights, ids
+        self.size = end
+        self.refit(start)
+
+    def remove(self, entry_id):
+        """
+        Remove an entry from the trend.
+        """
+        rows = np.flatnonzero(self.ids[:self.size] == entry_id)
+        if not len(rows):
+            return
+        row = int(rows[0])
+        for array in (self.days, self.weights, self.ids):
+            array[row:self.size-1] = array[row+1:self.size]
+        self.size -= 1
+        self.refit(row)
+
+    def current(self):
+        """
+        Get the newest smoothed weight, None if there are no entries.
+        """
+        return float(self.smoothed[self.size-1]) if self.size else None
+
+    def rate(self, days=None):
+        """
+        Get the slope of the least squares line through the entries of the last days days
+        up to the newest entry, in Lbs per week. None if they don't span more than one day.
+        """
+        if days is None:
+            days = trendDays
+        if not self.size:
+            return None
+        end = self.size
+        start = int(np.searchsorted(self.days[:end], self.days[end-1] - days + 1, 'left'))
+        n = end - start
+        x, y, xy, xx = (float(self.prefix[name][end] - self.prefix[name][start]) for name in ('x', 'y', 'xy', 'xx'))
+        spread = n * xx - x * x
+        if n < 2 or spread <= 1e-9:
+            return None
+        return (n * xy - x * y) / spread * 7
+
+    def forecast(self, goal):
+        """
+        Get the date the smoothed weight reaches goal at the current rate,
+        None if it's moving away from it or would take more than ten years.
+        """
+        current, rate = self.current(), self.rate()
+        if current is None or not rate or (goal - current) * rate <= 0:
+            return None
+        weeks = (goal - current) / rate
+        if weeks > 520:
+            return None
+        newest = np.datetime64(int(self.days[self.size-1]), 'D').astype(datetime)
+        return newest + timedelta(weeks=weeks)
+
+    def series(self):
+        """
+        Get copies of the dates and smoothed weights, oldest first.
+        """
+        return self.days[:self.size].astype('datetime64[D]'), self.smoothed[:self.size].copy()
+
+def logKind(filename):
+    """
+    Function to get the kind of a log from its JSON file's name ('weight', 'strength', ...).
+    """
+    kind = os.path.splitext(os.path.basename(filename))[0]
+    if kind not in logSchemas:
+        raise ValueError(f'No log kind for {filename}')
+    return kind
+
+class SnapshotEntries:
+    """
+    Entries of a log read from its memory-mapped binary snapshot, used in place of the dict readSnapshot builds.
+
+    It behaves like a dict of entries keyed by id, but an entry's dict is only made when it is looked up,
+    so opening a log allocates nothing per entry. Numbers come back as their shortest text ('3.10' reads back as '3.1').
+    Entries added later are kept in an ordinary dict after the snapshot's, deleted snapshot rows by row number.
+    """
+    def __init__(self, kind, records, labels):
+        self.kind = kind
+        self.records = records
+        self.labels = labels
+        self.ids = records['id']
+        self.sorted = bool(np.all(np.diff(self.ids) > 0))
+        self.deleted = set()
+        self.added = {}
+        self.rowIndex = None
+
+    def row(self, entry_id):
+        """
+        Get the snapshot row of an id, or None if it isn't a live snapshot row.
+        """
+        if self.sorted:
+            row = int(np.searchsorted(self.ids, entry_id))
+        else:
+            if self.rowIndex is None:
+                self.rowIndex = dict(zip(self.ids.tolist(), range(len(self.ids))))
+            row = self.rowIndex.get(entry_id, len(self.ids))
+        if row < len(self.ids) and self.ids[row] == entry_id and row not in self.deleted:
+            return row
+        return None
+
+    def entry(self, row):
+        """
+        Make the dict of the entry in a snapshot row.
+        """
+        record = self.records[row]
+        entry = {}
+        for name, dtype in logSchemas[self.kind].items():
+            if dtype == 'category':
+                entry[name] = self.labels[name][record[name]]
+            elif dtype == 'float32':
+                entry[name] = np.format_float_positional(record[name], trim='-')
+            else:
+                entry[name] = str(int(record[name]))
+        entry['date'] = np.datetime64(int(record['day']), 'D').item().strftime('%m-%d-%Y')
+        entry['id'] = int(record['id'])
+        return entry
+
+    def __len__(self):
+        return len(self.ids) - len(self.deleted) + len(self.added)
+
+    def __contains__(self, entry_id):
+        return entry_id in self.added or self.row(entry_id) is not None
+
+    def __getitem__(self, entry_id):
+        if entry_id in self.added:
+            return self.added[entry_id]
+        row = self.row(entry_id)
+        if row is None:
+            raise KeyError(entry_id)
+        return self.entry(row)
+
+    def __setitem__(self, entry_id, entry):
+        # Ids are never handed out twice, so an id already in the snapshot is the same entry. That happens when
+        # a crash during compaction leaves the old journal behind the new snapshot, and replaying it again is a no-op.
+        if self.row(entry_id) is None:
+            self.added[entry_id] = entry
+
+    def __delitem__(self, entry_id):
+        if entry_id in self.added:
+            del self.added[entry_id]
+            return
+        row = self.row(entry_id)
+        if row is None:
+            raise KeyError(entry_id)
+        self.deleted.add(row)
+
+    def pop(self, entry_id, *default):
+        try:
+            entry = self[entry_id]
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        del self[entry_id]
+        return entry
+
+    def liveRows(self, reverse=False):
+        """
+        Get the snapshot rows that aren't deleted, in order or newest first.
+        """
+        rows = range(len(self.ids) - 1, -1, -1) if reverse else range(len(self.ids))
+        return (row for row in rows if row not in self.deleted)
+
+    def __iter__(self):
+        yield from (int(self.ids[row]) for row in self.liveRows())
+        yield from list(self.added)
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        return SnapshotValues(self)
+
+class SnapshotValues:
+    """
+    Values view of SnapshotEntries, reversible like a dict's so a page of the newest entries only makes those entries.
+    """
+    def __init__(self, entries):
+        self.entries = entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        yield from (self.entries.entry(row) for row in self.entries.liveRows())
+        yield from list(self.entries.added.values())
+
+    def __reversed__(self):
+        yield from reversed(list(self.entries.added.values()))
+        yield from (self.entries.entry(row) for row in self.entries.liveRows(reverse=True))
+
+def binaryDtype(kind):
+    """
+    Function to get the record layout of a kind of log's binary snapshot.
+    """
+    fields = [('day', '<i4'), ('id', '<i4')]
+    for name, dtype in logSchemas[kind].items():
+        fields.append((name, '<i2' if dtype == 'category' else '<' + np.dtype(dtype).str[1:]))
+    return np.dtype(fields)
+
+def writeBinary(filename, entries):
+    """
+    Function to write the binary snapshot of the entries of a file's JSON snapshot.
+    Its metadata, with the mtime and size of the JSON it was made from, is written last,
+    so a half written binary snapshot is never taken for a current one.
+    """
+    kind = logKind(filename)
+    columns = LogColumns(kind, list(entries.values()))
+    records = np.empty(columns.size, binaryDtype(kind))
+    records['day'] = columns['date'].astype(np.int32)
+    records['id'] = columns['id']
+    for name in logSchemas[kind]:
+        records[name] = columns[name]
+    stat = os.stat(filename)
+    meta = {
+        'rows': columns.size,
+        'labels': columns.labels,
+        'next_id': int(columns['id'].max()) + 1 if columns.size else 1,
+        'source': [stat.st_mtime_ns, stat.st_size],
+    }
+    try:
+        with atomicFile(filename + binarySuffix, 'wb') as f:
+            np.save(f, records)
+        with atomicFile(filename + metaSuffix) as f:
+            json.dump(meta, f)
+    except OSError:
+        pass  # The binary snapshot may still be mapped (Windows won't replace it), it is rebuilt on a later load
+
+def readBinary(filename):
+    """
+    Function to memory-map a file's binary snapshot as SnapshotEntries,
+    or None if it is missing or older than the JSON snapshot.
+    """
+    kind = logKind(filename)
+    try:
+        with open(filename + metaSuffix, 'r') as f:
+            meta = json.load(f)
+        stat = os.stat(filename)
+        if meta['source'] != [stat.st_mtime_ns, stat.st_size]:
+            return None
+        # An empty array can't be memory-mapped
+        records = np.load(filename + binarySuffix, mmap_mode='r') if meta['rows'] else np.empty(0, binaryDtype(kind))
+        if len(records) != meta['rows'] or records.dtype != binaryDtype(kind):
+            return None
+    except (OSError, ValueError, KeyError, json.decoder.JSONDecodeError):
+        return None
+    nextIds[filename] = meta['next_id']
+    return SnapshotEntries(kind, records, meta['labels'])
+
+# SQL for the computed columns of LogColumns
+sqliteMetrics = {
+    'one_rm': 'weight / (1.0278 - 0.0278 * reps)',
+    'time': 'minutes + seconds / 60.0',
+    'speed': 'distance / (minutes + seconds / 60.0) * 60',
+}
+
+def sqlitePath(filename):
+    """
+    Function to get the path of the SQLite database that holds a log.
+    """
+    return os.path.join(os.path.dirname(filename), sqliteName)
+
+def sqliteTable(filename):
+    """
+    Function to get the table of a log, named after its JSON file ('weight', 'strength', ...).
+    """
+    return logKind(filename)
+
+def sqliteConnect(filename):
+    """
+    Function to open the SQLite database of a log, creating the tables and indexes on first use.
+    Fields are stored as TEXT, exactly as they were typed, and SQLite converts them for arithmetic.
+    """
+    path = sqlitePath(filename)
+    if path not in sqliteConnections:
+        connection = sqlite3.connect(path, check_same_thread=False)
+        for table, fields in logSchemas.items():
+            columns = ', '.join(f'{name} TEXT' for name in fields)
+            connection.execute(f'CREATE TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY AUTOINCREMENT, date TEXT NOT NULL, day INTEGER NOT NULL, {columns})')
+            connection.execute(f'CREATE INDEX IF NOT EXISTS {table}_day ON {table} (day)')
+        connection.execute('CREATE INDEX IF NOT EXISTS strength_exercise ON strength (exercise, day)')
+        connection.commit()
+        sqliteConnections[path] = connection
+    return sqliteConnections[path]
+
+def sqliteRow(table, entry):
+    """
+    Function to turn an entry into a row of its table. 'day' is the date's ordinal, used for range queries.
+    """
+    day = datetime.strptime(entry['date'], '%m-%d-%Y').toordinal()
+    return [entry['id'], entry['date'], day] + [entry[name] for name in logSchemas[table]]
+
+def sqliteLoad(filename):
+    """
+    Function to load the entries of a log from SQLite, keyed by id.
+    """
+    connection = sqliteConnect(filename)
+    table = sqliteTable(filename)
+    fields = list(logSchemas[table])
+    entries = {}
+    for row in connection.execute(f"SELECT id, date, {', '.join(fields)} FROM {table} ORDER BY id"):
+        entry = dict(zip(fields, row[2:]))
+        entry['date'] = row[1]
+        entry['id'] = row[0]
+        entries[row[0]] = entry
+    sequence = connection.execute('SELECT seq FROM sqlite_sequence WHERE name = ?', (table,)).fetchone()
+    nextIds[filename] = (sequence[0] if sequence else 0) + 1
+    return entries
+
+def sqliteAppend(filename, *records):
+    """
+    Function to apply add and delete records to a log's table in one transaction.
+    """
+    connection = sqliteConnect(filename)
+    table = sqliteTable(filename)
+    for record in records:
+        if record['op'] == 'add':
+            row = sqliteRow(table, record['entry'])
+            connection.execute(f"INSERT INTO {table} VALUES ({', '.join('?' * len(row))})", row)
+        elif record['op'] == 'delete':
+            connection.execute(f'DELETE FROM {table} WHERE id = ?', (record['id'],))
+    connection.commit()
+    dataVersions[filename] = dataVersions.get(filename, 0) + 1
+
+def sqliteWrite(filename, entries):
+    """
+    Function to replace every row of a log's table with entries, keeping the log's next id.
+    """
+    connection = sqliteConnect(filename)
+    table = sqliteTable(filename)
+    rows = [sqliteRow(table, entry) for entry in entries.values()]
+    with connection:
+        connection.execute(f'DELETE FROM {table}')
+        if rows:
+            connection.executemany(f"INSERT INTO {table} VALUES ({', '.join('?' * len(rows[0]))})", rows)
+        connection.execute('DELETE FROM sqlite_sequence WHERE name = ?', (table,))
+        connection.execute('INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)', (table, nextIds.get(filename, 1) - 1))
+    dataVersions[filename] = dataVersions.get(filename, 0) + 1
+
+def sqliteWindowAverages(filename, metrics, days, exercise=None):
+    """
+    Function to average metrics over the last days days, today included, inside SQLite.
+    """
+    connection = sqliteConnect(filename)
+    table = sqliteTable(filename)
+    today = datetime.today().toordinal()
+    query = f"SELECT {', '.join(f'AVG({sqliteMetrics.get(name, name)})' for name in metrics)} FROM {table} WHERE day > ? AND day <= ?"
+    parameters = [today - days, today]
+    if exercise is not None:
+        query += ' AND exercise = ?'
+        parameters.append(exercise)
+    row = connection.execute(query, parameters).fetchone()
+    return {name: value or 0.0 for name, value in zip(metrics, row)}
+
+def migrateToSqlite(files):
+    """
+    Function to copy JSON logs into SQLite, replacing whatever the tables held.
+    """
+    for file in files:
+        entries = loadFile(file)
+        sqliteWrite(file, entries)
+        print(f'{file}: {len(entries)} entries copied to {sqlitePath(file)}')
+
+def writeRecord(file, *records):
+    """
+    Function to write add or delete records with the storage backend in use, all in one write.
+    """
+    if storageBackend == 'sqlite':
+        sqliteAppend(file, *records)
+    else:
+        appendJournal(file, *records)
+
+def windowAverages(file, columns, metrics, days, exercise=None):
+    """
+    Function to average metrics over the last days days with the storage backend in use.
+    SQLite answers with a query, otherwise the rolling aggregate of the columns is used.
+    exercise is a strength exercise code.
+    """
+    if storageBackend == 'sqlite':
+        label = None if exercise is None else columns.labels['exercise'][exercise]
+        return sqliteWindowAverages(file, metrics, days, label)
+    aggregate = columns.aggregate(metrics, exercise)
+    return {name: aggregate.average(name, days) for name in metrics}
+
+def getColumns(filename, entries, kind):
+    """
+    Function to get the columns of a log, building them only when the log was (re)loaded.
+    """
+    cached = columnCache.get(filename)
+    if cached is None or cached[0] is not entries:
+        if isinstance(entries, SnapshotEntries):
+            columns = LogColumns(kind, [])
+            columns.extend_snapshot(entries)
+        else:
+            columns = LogColumns(kind, list(entries.values()))
+        cached = (entries, columns)
+        columnCache[filename] = cached
+    return cached[1]
+
+# Cardio rollups, worked out once per version of the cardio log. Best efforts are the fastest run
+# in each distance bucket, paces are counted in bins of a minute per mile up to maxPace.
+rollupCache = {}
+effortBuckets = [(0, 'Under 1 Mile'), (1, '1 Mile - 5K'), (3.1, '5K - 10K'), (6.2, '10K - Half'), (13.1, 'Half - Marathon'), (26.2, 'Marathon +')]
+maxPace = 30
+
+def cardioRollups(file, columns):
+    """
+    Function to get the weekly and monthly totals, pace histogram and best efforts of the cardio log.
+    Runs are grouped by their week (starting on Monday) or month index with bincount, nothing loops over runs.
+    The result is cached until the log changes.
+    """
+    version = dataVersions.get(file, 0)
+    cached = rollupCache.get(file)
+    if cached is not None and cached[0] == version and cached[1] is columns:
+        return cached[2]
+    days = columns.live('date').astype(np.int64)
+    distance = columns.live('distance').astype(np.float64)
+    minutes = columns.live('time').astype(np.float64)
+    speed = columns.live('speed').astype(np.float64)
+    rollups = {}
+    for period, index in (('week', (days + 3) // 7), ('month', days.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64))):
+        first = int(index.min()) if len(index) else 0
+        index = index - first
+        miles = np.bincount(index, distance).astype(np.float64)  # bincount of no runs is an int array
+        totalMinutes = np.bincount(index, minutes).astype(np.float64)
+        starts = first + np.arange(len(miles))
+        rollups[period] = {
+            'start': (starts * 7 - 3).astype('datetime64[D]') if period == 'week' else starts.astype('datetime64[M]').astype('datetime64[D]'),
+            'distance': miles,
+            'time': totalMinutes,
+            'runs': np.bincount(index),
+            'pace': np.divide(totalMinutes, miles, out=np.zeros_like(miles), where=miles > 0),  # Minutes per mile
+        }
+
+    # Pace of every run that has both a distance and a time, in one minute bins
+    valid = (distance > 0) & (minutes > 0)
+    paces = np.minimum(minutes[valid] / distance[valid], maxPace)
+    low = int(paces.min()) if len(paces) else 0
+    counts = np.bincount(paces.astype(np.int64) - low) if len(paces) else np.zeros(0, np.int64)
+    rollups['paces'] = [(low + i, int(count)) for i, count in enumerate(counts)]
+
+    # Fastest run of every distance bucket, the last run of each bucket after sorting by bucket then speed
+    bucket = np.searchsorted([edge for edge, label in effortBuckets], distance[valid], 'right') - 1
+    order = np.lexsort((speed[valid], bucket))
+    best = order[np.flatnonzero(np.diff(bucket[order], append=len(effortBuckets)))]
+    runs = np.bincount(bucket, minlength=len(effortBuckets))
+    dates = days[valid].astype('datetime64[D]')
+    rollups['bests'] = [(effortBuckets[bucket[row]][1], int(runs[bucket[row]]), float(distance[valid][row]), float(minutes[valid][row]), float(speed[valid][row]), dates[row].astype(datetime)) for row in best]
+    rollupCache[file] = (version, columns, rollups)
+    return rollups
+
+# Meditation factor analysis, worked out once per version of the meditation log
+factorCache = {}
+meditationFactors = ['position', 'sound', 'inorout']
+
+def meditationCrossTab(file, columns):
+    """
+    Function to get the sessions, mean rating and mean length of every combination of position, sound and setting
+    that has sessions, as [position, sound, inorout, sessions, rating, length] rows.
+    The category codes of a session are combined into one index and every combination is summed with bincount.
+    The result is cached until the log changes.
+    """
+    version = dataVersions.get(file, 0)
+    cached = factorCache.get(file)
+    if cached is not None and cached[0] == version and cached[1] is columns:
+        return cached[2]
+    sizes = [len(columns.labels[name]) for name in meditationFactors]
+    combined = np.zeros(len(columns.live('rating')), np.int64)
+    for name, size in zip(meditationFactors, sizes):
+        combined = combined * size + columns.live(name)
+    total = int(np.prod(sizes))
+    sessions = np.bincount(combined, minlength=total)
+    ratings = np.bincount(combined, columns.live('rating').astype(np.float64), minlength=total)
+    lengths = np.bincount(combined, columns.live('length').astype(np.float64), minlength=total)
+    rows = []
+    for index in np.flatnonzero(sessions).tolist():
+        codes = np.unravel_index(index, sizes)
+        labels = [columns.labels[name][code] for name, code in zip(meditationFactors, codes)]
+        rows.append(labels + [int(sessions[index]), float(ratings[index] / sessions[index]), float(lengths[index] / sessions[index])])
+    factorCache[file] = (version, columns, rows)
+    return rows
+
+def render_log(window, screen, file, entries, format_entry):
+    """
+    Function to show the current page of a log in the '-OUTPUT-' element of a screen with one update.
+    Only the entries on the page are numbered and formatted with format_entry(number, entry),
+    and their numbers are remembered so delete_entry can turn a typed number back into an id.
+    """
+    total = len(entries)
+    size = logPageSize or max(total, 1)
+    page = min(logPages.get(file, 0), max(0, (total - 1) // size))
+    logPages[file] = page
+    end = total - page * size
+    start = max(0, end - size)
+    rows = list(itertools.islice(reversed(entries.values()), total - end, total - start))
+    rows.reverse()
+    displayIds[file] = {}
+    lines = []
+    for number, entry in enumerate(rows, start + 1):
+        displayIds[file][number] = entry['id']
+        lines.append(format_entry(number, entry))
+    window[(screen, '-OUTPUT-')].update('\n'.join(lines) if lines else 'Empty')
+    window[(screen, '-PAGE-')].update(f'{start + 1}-{end} of {total}' if total else '')
+
+def turn_page(file, action):
+    """
+    Function to move the log pane of a file to older or newer entries on the 'Older' and 'Newer' buttons.
+    """
+    if action == 'Older':
+        logPages[file] = logPages.get(file, 0) + 1
+    elif action == 'Newer':
+        logPages[file] = max(0, logPages.get(file, 0) - 1)
+
+def store_entry(entries, file, entry):
+    """
+    Function to give an entry a new id, add it to a log and its columns and write it to a file.
+    """
+    store_entries(entries, file, [entry])
+
+def store_entries(entries, file, new):
+    """
+    Function to give entries new ids, add them to a log and its columns and write them to a file in one write.
+    """
+    if not new:
+        return
+    with dataLock(file):
+        parsed = parseEntries(logKind(file), new)  # A bad value fails here, before the log or the file changes
+        for entry in new:
+            entry['id'] = nextIds[file]
+            nextIds[file] += 1
+            entries[entry['id']] = entry
+        writeRecord(file, *[{'op': 'add', 'entry': entry} for entry in new])
+        cacheStore(file, entries)
+        if file in columnCache and columnCache[file][0] is entries:
+            columnCache[file][1].extend(new, parsed)
+
+def remove_entry(entries, file, entry_id):
+    """
+    Function to delete an entry by id from a log and its columns and record the delete in the file.
+    """
+    with dataLock(file):
+        del entries[entry_id]
+        writeRecord(file, {'op': 'delete', 'id': entry_id})
+        cacheStore(file, entries)
+        if file in columnCache and columnCache[file][0] is entries:
+            columnCache[file][1].delete(entry_id)
+
+def add_entry(window, entries, file, entry):
+    """
+    Function to add an entry to a log and show the newest page of it.
+    If the input is invalid, it shows a popup with 'Invalid Input'.
+    """
+    try:
+        store_entry(entries, file, entry)
+        logPages[file] = 0
+        window.un_hide()
+    except:
+        sg.popup('Invalid Input', font=(0,10), no_titlebar=True)
+        window.un_hide()
+
+def delete_entry(window, entries, file):
+    """
+    Function to delete an entry from a log and record the delete in the file.
+    If the input is invalid, it shows a popup with 'Invalid Input'.
+    """
+    try:
+        window.hide()
+        entry = sg.PopupGetText('Number: ')
+        if entry == None:
+            pass
+        else:
+            number = int(entry)
+            if number in displayIds.get(file, {}):
+                entry_id = displayIds[file][number]
+            else:
+                entry_id = list(entries)[number -1]
+            remove_entry(entries, file, entry_id)
+        window.un_hide()
+    except:
+        sg.popup('Invalid Input', font=(0,10), no_titlebar=True)
+        window.un_hide()
+
+# Cardio importer. GPX/TCX files are streamed with iterparse and their trackpoints measured in chunks of
+# importChunk points, so a file of any length is imported in the same memory.
+earthRadius = 3958.8  # Miles
+importChunk = 10000
+importTypes = (('Activity files', '*.gpx *.tcx *.csv'), ('GPX', '*.gpx'), ('TCX', '*.tcx'), ('CSV', '*.csv'))
+
+def haversineMiles(lats, lons):
+    """
+    Function to get the total great-circle distance in miles along arrays of latitudes and longitudes.
+    """
+    if len(lats) < 2:
+        return 0.0
+    lats, lons = np.radians(lats), np.radians(lons)
+    a = np.sin(np.diff(lats) / 2) ** 2 + np.cos(lats[:-1]) * np.cos(lats[1:]) * np.sin(np.diff(lons) / 2) ** 2
+    return float(np.sum(2 * earthRadius * np.arcsin(np.sqrt(np.minimum(a, 1)))))
+
+def parseTimestamp(text):
+    """
+    Function to parse an ISO 8601 timestamp from a GPX or TCX file into a local datetime.
+    """
+    stamp = datetime.fromisoformat(text.strip().replace('Z', '+00:00'))
+    return stamp.astimezone() if stamp.tzinfo else stamp
+
+def readTrack(path):
+    """
+    Function to stream the activities of a GPX or TCX file.
+    Yields (start, seconds, miles, points) for every track (GPX) or activity (TCX) in the file.
+    Distance is measured along the trackpoints, a TCX activity without positions uses its DistanceMeters.
+    """
+    gpx = path.lower().endswith('.gpx')
+    activityTag, segmentTag, pointTag = ('trk', 'trkseg', 'trkpt') if gpx else ('Activity', 'Track', 'Trackpoint')
+    lats, lons = [], []
+    previous, miles, points, first, last, meters = None, 0.0, 0, None, None, 0.0
+    for event, element in ElementTree.iterparse(path):
+        tag = element.tag.rsplit('}', 1)[-1]
+        if tag == pointTag:
+            values = {child.tag.rsplit('}', 1)[-1]: child.text for child in element.iter()}
+            lat, lon = (element.get('lat'), element.get('lon')) if gpx else (values.get('LatitudeDegrees'), values.get('LongitudeDegrees'))
+            # Only the first and last times are parsed, when the activity ends
+            stamp = values.get('time' if gpx else 'Time')
+            if stamp:
+                last = stamp
+                first = first or stamp
+            if lat is not None and lon is not None:
+                lats.append(float(lat))
+                lons.append(float(lon))
+            if values.get('DistanceMeters'):
+                meters = max(meters, float(values['DistanceMeters']))
+            points += 1
+            element.clear()
+        if lats and (len(lats) >= importChunk or tag in (segmentTag, activityTag)):
+            # Measure the chunk, continuing from the last point of the chunk before it
+            lat = np.array(([previous[0]] if previous else []) + lats)
+            lon = np.array(([previous[1]] if previous else []) + lons)
+            miles += haversineMiles(lat, lon)
+            previous = (lats[-1], lons[-1])
+            lats, lons = [], []
+        if tag == segmentTag:
+            previous = None  # Gaps between segments aren't part of the distance
+            element.clear()
+        elif tag == activityTag:
+            if first is not None:
+                start = parseTimestamp(first)
+                yield start, (parseTimestamp(last) - start).total_seconds(), miles or meters / 1609.344, points
+            previous, miles, points, first, last, meters = None, 0.0, 0, None, None, 0.0
+            element.clear()
+
+def readActivityCsv(path):
+    """
+    Function to stream the activities of a CSV file, one per row.
+    Needs a date column (MM-DD-YYYY or YYYY-MM-DD), a distance column in miles, and either
+    minutes and seconds columns or a duration column ([H:]MM:SS or seconds).
+    Yields (start, seconds, miles, points) like readTrack.
+    """
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            row = {key.strip().lower(): (value or '').strip() for key, value in row.items() if key}
+            date = row['date']
+            start = datetime.strptime(date, '%m-%d-%Y') if re.match(r'\d\d-\d\d-\d{4}$', date) else datetime.fromisoformat(date)
+            if row.get('duration'):
+                seconds = 0.0
+                for part in row['duration'].split(':'):
+                    seconds = seconds * 60 + float(part)
+            else:
+                seconds = int(row.get('minutes') or 0) * 60 + float(row.get('seconds') or 0)
+            yield start, seconds, float(row['distance']), 0
+
+def cardioKey(entry):
+    """
+    Function to get what makes two cardio entries the same run: date, distance to 0.01 mile and time to the second.
+    """
+    return (entry['date'], round(float(entry['distance']), 2), int(entry['minutes']) * 60 + int(entry['seconds']))
+
+def importCardio(paths, entries):
+    """
+    Function to import the activities of GPX, TCX and CSV files into the cardio log with one write.
+    Activities already in the log (or earlier in the same import) are skipped.
+    Returns a report of how many runs were imported and how fast.
+    """
+    begin = time.perf_counter()
+    seen = set(cardioKey(entry) for entry in entries.values())
+    new = []
+    report = {'files': 0, 'imported': 0, 'duplicates': 0, 'skipped': 0, 'points': 0}
+    for path in paths:
+        activities = readActivityCsv(path) if path.lower().endswith('.csv') else readTrack(path)
+        for start, seconds, miles, points in activities:
+            report['points'] += points
+            if seconds <= 0 or miles <= 0:
+                report['skipped'] += 1
+                continue
+            seconds = int(round(seconds))
+            entry = {
+                'distance': f'{miles:.2f}',
+                'minutes': str(seconds // 60),
+                'seconds': str(seconds % 60),
+                'date': start.strftime('%m-%d-%Y')
+            }
+            if cardioKey(entry) in seen:
+                report['duplicates'] += 1
+                continue
+            seen.add(cardioKey(entry))
+            new.append(entry)
+        report['files'] += 1
+    store_entries(entries, cardioFile, new)
+    report['imported'] = len(new)
+    report['seconds'] = time.perf_counter() - begin
+    return report
+
+def importSummary(report):
+    """
+    Function to describe an import report in one line.
+    """
+    rate = report['points'] / report['seconds'] if report['seconds'] else 0
+    return (f"{report['imported']} runs imported from {report['files']} files, {report['duplicates']} duplicates and {report['skipped']} empty activities skipped. "
+            f"{report['points']} trackpoints in {report['seconds']:.2f} s ({rate:,.0f} points/s)")
+
+def import_cardio(window, cardioList):
+    """
+    Function to ask for activity files and import them into the cardio log.
+    If a file can't be read, it shows a popup with 'Invalid File'.
+    """
+    window.hide()
+    files = sg.popup_get_file('Activity files: ', multiple_files=True, file_types=importTypes)
+    if files:
+        try:
+            report = importCardio(files.split(';'), cardioList)
+            logPages[cardioFile] = 0
+            sg.popup(importSummary(report), font=textFont)
+        except (OSError, ValueError, KeyError, ElementTree.ParseError) as error:
+            sg.popup('Invalid File', str(error), font=(0,10), no_titlebar=True)
+    window.un_hide()
+
+# Export. Columns worked out from the entries are written next to the logged fields.
+derivedColumns = {'strength': ['one_rm'], 'cardio': ['time', 'speed']}
+
+def exportRows(entries, columns, kind):
+    """
+    Function to generate the CSV rows of a log one entry at a time, header first.
+    """
+    fields = list(logSchemas[kind])
+    derived = derivedColumns.get(kind, [])
+    yield ['id', 'date'] + fields + derived
+    for entry in entries.values():
+        row = columns.row(entry['id'])
+        yield [entry['id'], entry['date']] + [entry[name] for name in fields] + [f'{float(columns[name][row]):.2f}' for name in derived]
+
+def exportCsv(file, kind, path):
+    """
+    Function to stream a log to a CSV file, returning the number of entries written.
+    """
+    entries = readFile(file, {}, None)
+    with open(path, 'w', newline='') as f:
+        csv.writer(f).writerows(exportRows(entries, getColumns(file, entries, kind), kind))
+    return len(entries)
+
+def exportNpz(file, kind, path):
+    """
+    Function to save the columns of a log's entries to an uncompressed .npz file, returning the number of entries written.
+    Categories are saved as their codes with the labels in '<name>_labels'.
+    """
+    entries = readFile(file, {}, None)
+    columns = getColumns(file, entries, kind)
+    arrays = {name: columns.live(name) for name in columns.columns if name != 'alive'}
+    for name, labels in columns.labels.items():
+        arrays[name + '_labels'] = np.array(labels, dtype=str)
+    np.savez(path, **arrays)
+    return len(arrays['id'])
+
+def loadExport(path):
+    """
+    Function to load a .npz export back into a dict of arrays.
+    """
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files}
+
+def exportLogs(folder):
+    """
+    Function to export every log to '<kind>.csv' and '<kind>.npz' in a folder.
+    """
+    os.makedirs(folder, exist_ok=True)
+    for kind in screens:
+        file = screen_file(kind)
+        count = exportCsv(file, kind, os.path.join(folder, kind + '.csv'))
+        exportNpz(file, kind, os.path.join(folder, kind + '.npz'))
+        print(f'{file}: {count} entries exported to {os.path.join(folder, kind)}.csv/.npz')
+
+def create_graph(title, ylabel):
+    """
+    Function to create a long-lived figure and axes for a screen's graph.
+    The figure is not registered with pyplot, so it is never leaked by the figure manager.
+    """
+    fig = Figure()
+    ax = fig.add_subplot()
+    ax.xaxis_date()
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d-%Y'))
+    ax.set_title(title)
+    ax.set_xlabel('Date')
+    ax.set_ylabel(ylabel)
+    ax.grid()
+    graph = {'fig': fig, 'ax': ax, 'lines': {}, 'series': {}}
+    # Zooming and panning with the toolbar changes the x range, so the lines are decimated again for it
+    ax.callbacks.connect('xlim_changed', lambda ax: decimate_lines(graph))
+    return graph
+
+def attach_graph(graph, element):
+    """
+    Function to put a graph's canvas and toolbar into a canvas element.
+    This happens once per window, every later update only redraws the existing canvas.
+    """
+    canvas_agg = FigureCanvasTkAgg(graph['fig'], master=element.TKCanvas)
+    toolbar = NavigationToolbar2Tk(canvas_agg, element.TKCanvas)
+    toolbar.update()
+    canvas_agg.get_tk_widget().pack(side='top', fill='both', expand=1)
+    graph['canvas'] = canvas_agg
+    graph['toolbar'] = toolbar
+
+def decimate(x, y, low, high, width):
+    """
+    Function to reduce a series sorted by x to the lowest and highest point of every pixel column between low and high.
+    One point either side of the range is kept so the line runs off the edge of the graph instead of stopping short.
+    Series that already fit in pointsPerPixel points per pixel are returned whole.
+    """
+    start = max(int(np.searchsorted(x, low, 'left')) - 1, 0)
+    end = min(int(np.searchsorted(x, high, 'right')) + 1, len(x))
+    x, y = x[start:end], y[start:end]
+    if len(x) <= pointsPerPixel * width:
+        return x, y
+    # Pixel column of every point, the points outside the range get columns of their own
+    column = np.clip(np.floor((x - low) / (high - low) * width), -1, width).astype(np.int64)
+    starts = np.flatnonzero(np.diff(column, prepend=column[0] - 1))
+    counts = np.diff(np.append(starts, len(x)))
+    keep = [starts, starts + counts - 1]
+    for reduce in (np.minimum, np.maximum):
+        # First point of each column that holds the column's extreme
+        hits = np.flatnonzero(y == np.repeat(reduce.reduceat(y, starts), counts))
+        keep.append(hits[np.diff(column[hits], prepend=column[hits[0]] - 1) != 0] if len(hits) else hits)
+    keep = np.unique(np.concatenate(keep))
+    return x[keep], y[keep]
+
+def decimate_lines(graph, labels=None):
+    """
+    Function to set the lines of a graph to their series decimated to the visible x range and the width of the axes.
+    """
+    ax = graph['ax']
+    low, high = ax.get_xlim()
+    width = max(int(ax.bbox.width), 1)
+    for label in graph['lines'] if labels is None else labels:
+        graph['lines'][label].set_data(*decimate(*graph['series'][label], low, high, width))
+
+def update_line(graph, label, x, y, marker='o'):
+    """
+    Function to push new data into a graph's line, creating the line the first time it is used.
+    The whole series is kept with the graph sorted by date, the line only gets the part that can be seen.
+    """
+    x = mdates.date2num(x)
+    order = np.argsort(x, kind='stable')
+    graph['series'][label] = (x[order], np.asarray(y, np.float64)[order])
+    if label not in graph['lines']:
+        graph['lines'][label], = graph['ax'].plot([], [], marker=marker, label=label)
+    decimate_lines(graph, [label])
+
+def remove_lines(graph, labels):
+    """
+    Function to remove every line of a graph whose label is not in labels.
+    """
+    for label in [i for i in graph['lines'] if i not in labels]:
+        graph['lines'].pop(label).remove()
+        graph['series'].pop(label)
+
+def redraw_graph(graph, start_date, ybottom=None, legend=True):
+    """
+    Function to rescale a graph to its current data and redraw its canvas.
+    A graph drawn after show_chart() is drawn straight away and a bitmap of it put in the chart cache.
+    """
+    ax = graph['ax']
+    ax.set_xlim(start_date, datetime.today())  # Decimates the lines for the range before they are measured
+    ax.relim()
+    ax.set_autoscaley_on(True)
+    ax.autoscale_view(scalex=False)
+    if ybottom is not None:
+        ax.set_ylim(bottom=ybottom)
+    if legend and graph['lines']:
+        ax.legend()
+    graph['fig'].autofmt_xdate()
+    key = graph.pop('pending', None)
+    if key is None:
+        graph['canvas'].draw_idle()
+        return
+    graph['canvas'].draw()
+    image = io.BytesIO()
+    mimage.imsave(image, np.asarray(graph['canvas'].buffer_rgba()), format='png', pil_kwargs={'compress_level': 1})
+    storeChart(key, image.getvalue())
+    graph['drawn'] = key
+
+# Bitmaps of drawn charts, newest last, shown in place of a graph's canvas when it would be drawn the same again.
+# The oldest are dropped once they take up more than chartCacheBytes.
+chartCache = collections.OrderedDict()
+chartCacheBytes = 32 * 2**20
+
+def storeChart(key, image):
+    """
+    Function to put the PNG bitmap of a chart in the chart cache, dropping the least recently used ones over the limit.
+    """
+    chartCache[key] = image
+    chartCache.move_to_end(key)
+    total = sum(len(image) for image in chartCache.values())
+    while total > chartCacheBytes and len(chartCache) > 1:
+        total -= len(chartCache.popitem(last=False)[1])
+
+def chart_key(name, file):
+    """
+    Function to get what a graph drawn from a log depends on, the size of its figure is added by show_chart().
+    The file's signature is left out as it changes when queued writes reach the disk, not only when the data does.
+    """
+    return (name, file, dataVersions.get(file, 0), loadCounts.get(file, 0), datetime.today().date())
+
+def chart_image(canvas):
+    """
+    Function to get the key of the image element shown in place of a canvas element.
+    """
+    return (canvas[0], canvas[1][:-1] + '-IMAGE-')
+
+def show_chart(window, graph, key):
+    """
+    Function to show a graph without drawing it when it can be, returns False if it has to be drawn.
+    The canvas is shown if it already has key drawn on it, otherwise a cached bitmap of key is shown in its place
+    until it's clicked. A graph that has to be drawn gets its bitmap cached by redraw_graph().
+    """
+    key = key + (tuple(int(size) for size in graph['fig'].bbox.size),)
+    canvas = graph['element']
+    if graph.get('drawn') == key:
+        showing, drawn = canvas, True
+    elif key in chartCache and not graph.get('live'):
+        chartCache.move_to_end(key)
+        window[chart_image(canvas)].update(data=chartCache[key])
+        showing, drawn = chart_image(canvas), True
+    else:
+        graph['pending'], graph['live'] = key, False
+        showing, drawn = canvas, False
+    if graph.get('showing', canvas) != showing:
+        window[canvas].update(visible=showing == canvas)
+        window[chart_image(canvas)].update(visible=showing != canvas)
+        graph['showing'] = showing
+    return drawn
+
+def live_chart(image):
+    """
+    Function to swap the interactive canvas back in for a chart's bitmap when it's clicked, to pan or zoom it.
+    The screen is loaded again so its graph is drawn.
+    """
+    for graph in graphs.values():
+        if graph.get('element') and chart_image(graph['element']) == image:
+            graph['live'] = True
+    screenShown.pop(image[0], None)
+
+def importPlotting():
+    """
+    Function to import the plotting stack, run on a background thread so windows open without waiting for it.
+    The window waiting for its graph gets a '-PLOT-READY-' event when it is done.
+    """
+    global mdates, mimage, Figure, FigureCanvasTkAgg, NavigationToolbar2Tk
+    np.ndarray
+    import matplotlib.dates
+    import matplotlib.image
+    import matplotlib.figure
+    import matplotlib.backends.backend_tkagg
+    mdates = matplotlib.dates
+    mimage = matplotlib.image
+    Figure = matplotlib.figure.Figure
+    FigureCanvasTkAgg = matplotlib.backends.backend_tkagg.FigureCanvasTkAgg
+    NavigationToolbar2Tk = matplotlib.backends.backend_tkagg.NavigationToolbar2Tk
+    plottingLoaded.set()
+    if plottingWaiter is not None:
+        plottingWaiter.write_event_value('-PLOT-READY-', None)
+
+def loadPlotting(window=None):
+    """
+    Function to start importing the plotting stack if it hasn't been started yet,
+    and to make window the one told when it is ready.
+    """
+    global plottingThread, plottingWaiter
+    plottingWaiter = window
+    if plottingThread is None:
+        plottingThread = threading.Thread(target=importPlotting, daemon=True)
+        plottingThread.start()
+
+# One graph per screen, created once the plotting stack is loaded and kept for the life of the program
+graphs = {}
+graphTitles = {
+    'weight': ('Weight History', 'Weight (Lbs)'),
+    'strength': ('Exercise Progress', 'Strength'),
+    'cardio': ('Cardio Progress', 'Speed/Distance/Time'),
+    'meditation': ('Meditation Ratings', 'Rating & Minutes'),
+    'rollups': ('Cardio Mileage', 'Miles'),
+}
+
+def screen_graph(name, window, canvas=None):
+    """
+    Function to get the graph of a screen, or None while the plotting stack is still loading.
+    The graph is attached to the screen's canvas (or the canvas element with key canvas) the first time it's used with the window.
+    """
+    if not plottingLoaded.is_set():
+        loadPlotting(window)
+        return None
+    if name not in graphs:
+        graphs[name] = create_graph(*graphTitles[name])
+    graph = graphs[name]
+    if graph.get('window') is not window:
+        graph['element'] = canvas or (name, '-CANVAS-')
+        attach_graph(graph, window[graph['element']])
+        graph['window'] = window
+    return graph
+
+def checkStartup():
+    """
+    Function to import this file in a fresh interpreter with -X importtime and check it against startupBudget.
+    Prints the slowest imports and returns 1 if the budget is blown or a lazy module was imported eagerly.
+    """
+    folder = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import fitness'], cwd=folder, capture_output=True, text=True)
+    imports = []
+    for line in result.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)', line)
+        if match:
+            imports.append((int(match.group(2)), len(match.group(3)), match.group(4)))
+    total = sum(cumulative for cumulative, depth, name in imports if depth == 1) / 1e6
+    for cumulative, depth, name in sorted(imports, reverse=True)[:10]:
+        print(f'{cumulative / 1000:8.1f} ms  {name}')
+    print(f'Import time: {total * 1000:.1f} ms (budget {startupBudget * 1000:.0f} ms)')
+    eager = sorted(set(name.split('.')[0] for cumulative, depth, name in imports if name.split('.')[0] in lazyModules))
+    failed = False
+    if eager:
+        print(f'STARTUP REGRESSION: imported at startup: {", ".join(eager)}')
+        failed = True
+    if total > startupBudget:
+        print(f'STARTUP REGRESSION: import time {total * 1000:.1f} ms is over the {startupBudget * 1000:.0f} ms budget')
+        failed = True
+    return 1 if failed else 0
+
+
+def load_weight(state):
+    """
+    Function to read the weight log and work out its averages, run on a worker thread.
+    """
+    # Read weight data from file and update list
+    with timed('weight.read'):
+        weightList = readFile(weightFile, state['entries'], None)
+    with timed('weight.columns'):
+        weightColumns = getColumns(weightFile, weightList, 'weight')  # Dates and weights parsed once
+        dates, weights = weightColumns.live('date'), weightColumns.live('weight')
+
+    # Calculate the weight average of every window
+    with timed('weight.averages'):
+        averages = [f"{days} Day Average: {windowAverages(weightFile, weightColumns, ['weight'], days)['weight']:.2f}" for days in averageWindows]
+
+    # Smoothed weight, rate and goal date from the trend, which is only refit from the entries that changed
+    with timed('weight.trend'):
+        trend = weightColumns.trend()
+        trendDates, trendWeights = trend.series()
+        current, rate = trend.current(), trend.rate()
+        if current is not None:
+            averages.append(f"Trend: {current:.2f} Lbs" + (f", {rate:+.2f} Lbs/Week" if rate is not None else ''))
+        goal = state.get('goal')
+        if goal is not None:
+            arrival = trend.forecast(goal)
+            averages.append(f"Goal {goal:g} Lbs: " + (arrival.strftime('%m-%d-%Y') if arrival else 'Not on current trend'))
+    return {'entries': weightList, 'dates': dates, 'weights': weights, 'trendDates': trendDates, 'trendWeights': trendWeights, 'averages': averages}
+
+def show_weight(window, state, data):
+    """
+    Function to fill the weight screen with the loaded weight log, its averages and the weight graph.
+    """
+    weightList = state['entries'] = data['entries']
+
+    # Show the current page of weight entries, numbered by position
+    with timed('weight.log'):
+        render_log(window, 'weight', weightFile, weightList, lambda number, entry: f"{number}. {entry['weight']} Lbs - {entry['date']}")
+    window[('weight', 'WEEKLY')].update('\n'.join(data['averages']))
+
+    # Push the weight history into the existing line and redraw the graph
+    with timed('weight.graph'):
+        graph = screen_graph('weight', window)  # None until matplotlib has been imported
+        if graph and not show_chart(window, graph, chart_key('weight', weightFile)):
+            update_line(graph, 'Weight', data['dates'], data['weights'])
+            update_line(graph, 'Trend', data['trendDates'], data['trendWeights'], marker='')
+            start_date = datetime(2024, 1, 17)  # Assuming weight data starts from this date
+            redraw_graph(graph, start_date)
+
+def add_weight(window, weightList):
+    """
+    Function to ask for the current weight and add it to the weight log.
+    """
+    window.hide()
+    entry1 = sg.PopupGetText('Current Weight: ')
+
+    # Validate weight input
+    if entry1 is None or not entry1.replace('.', '', 1).isdigit():
+        window.un_hide()  # Show window again if input is invalid
+    else:
+        entry = {
+            'weight': entry1,
+            'date': datetime.today().strftime('%m-%d-%Y')  # Use current date
+        }
+        add_entry(window, weightList, weightFile, entry)
+
+def set_goal(window, state):
+    """
+    Function to ask for a goal weight and save it with the profile's settings, leaving it empty clears the goal.
+    """
+    window.hide()
+    entry1 = sg.PopupGetText('Goal Weight (empty to clear): ')
+    if entry1 is not None and (entry1 == '' or entry1.replace('.', '', 1).isdigit()):
+        state['goal'] = float(entry1) if entry1 else None
+        writeSettings(dict(readSettings(), goal=state['goal']))
+    window.un_hide()
+
+def load_strength(state):
+    """
+    Function to read the strength log and work out the averages of the selected exercise, run on a worker thread.
+    The last exercise logged is selected if none is.
+    """
+    with timed('strength.read'):
+        strengthList = readFile(strengthFile, state['entries'], None)
+    with timed('strength.columns'):
+        strengthColumns = getColumns(strengthFile, strengthList, 'strength')
+    # Exercises in the order they were first logged, their position in this list is their code
+    exercises = list(strengthColumns.labels['exercise'])
+    exercise = state['exercise'] if state['exercise'] in exercises else (exercises[-1] if exercises else '')
+
+    # Get the days average of the selected exercise
+    averages = None
+    with timed('strength.averages'):
+        selected_exercise = strengthColumns.codes['exercise'].get(exercise)
+        if selected_exercise in strengthColumns.index:
+            averages = [windowAverages(strengthFile, strengthColumns, ['one_rm'], days, selected_exercise) for days in averageWindows]
+            averages = '\n'.join(f"{days} Day Average: {average['one_rm']:.2f}" for days, average in zip(averageWindows, averages))
+
+    # PRs and the summary table come from tables kept up to date by every add and delete
+    with timed('strength.summary'):
+        summary = strengthColumns.summary()
+        table, prs = summary.table(), set(summary.prs)
+    return {'entries': strengthList, 'columns': strengthColumns, 'exercises': exercises, 'exercise': exercise, 'averages': averages, 'table': table, 'prs': prs}
+
+def show_strength(window, state, data):
+    """
+    Function to fill the strength screen with the loaded exercise log, the averages of the selected exercise
+    and the estimated 1 rep max graph.
+    """
+    strengthList = state['entries'] = data['entries']
+    strengthColumns, exercises = data['columns'], data['exercises']
+
+    with timed('strength.lines'):
+        graph = screen_graph('strength', window)
+        if graph and show_chart(window, graph, chart_key('strength', strengthFile)):
+            graph = None  # Already drawn or shown from the chart cache
+        if state['plottedColumns'] is not strengthColumns:
+            state['plottedColumns'], state['plotted'] = strengthColumns, {}
+        plotted = state['plotted']  # Index version last plotted for each exercise
+
+        for code, exercise in enumerate(exercises):
+            # Plot the estimated 1 rep max of exercises whose entries changed
+            if graph and plotted.get(exercise) != strengthColumns.versions[code]:
+                rows = strengthColumns.rows(code)
+                update_line(graph, exercise, strengthColumns['date'][rows], strengthColumns['one_rm'][rows])
+                plotted[exercise] = strengthColumns.versions[code]
+
+    with timed('strength.log'):
+        prs = data['prs']
+        render_log(window, 'strength', strengthFile, strengthList, lambda number, i: f"{number}. {i['exercise']}: {i['weight']} Lbs, {i['reps']} Reps        -        {i['date']}" + ('   PR!' if i['id'] in prs else ''))
+    window[('strength', '-SUMMARY-')].update(values=data['table'])
+
+    # Update the option menu and the averages of the selected exercise
+    state['exercise'] = data['exercise']
+    window[('strength', 'OPTIONS')].update(values=exercises, value=state['exercise'])
+    if data['averages'] is not None:
+        window[('strength', 'WEEKLY')].update(data['averages'])
+
+    # Drop lines of exercises that no longer have entries and redraw the graph
+    with timed('strength.graph'):
+        if graph:
+            remove_lines(graph, exercises)
+            redraw_graph(graph, datetime(2024, 1, 1))
+
+def add_strength(window, strengthList):
+    """
+    Function to ask for an exercise, weight and reps and add them to the strength log.
+    """
+    window.hide()
+    entry1 = sg.PopupGetText('Exercise: ')
+    if entry1 == None:
+        window.un_hide()
+        pass
+    else:
+        entry2 = sg.PopupGetText('Weight: ')
+        # Validate weight input
+        if entry2 is None or not entry2.replace('.', '', 1).isdigit():
+            window.un_hide()
+            pass
+        else:
+            entry3 = sg.PopupGetText('Reps: ')
+            # Validate reps input
+            if entry3 is None or not entry3.isdigit():
+                window.un_hide()
+                pass
+            else:
+                entry = {
+                    'exercise': entry1.upper(),
+                    'weight': entry2,
+                    'reps': entry3,
+                    'date': datetime.today().strftime('%m-%d-%Y')
+                }
+                add_entry(window, strengthList, strengthFile, entry)
+
+def load_cardio(state):
+    """
+    Function to read the cardio log and work out its averages, run on a worker thread.
+    """
+    # Read data from cardio file and update list
+    with timed('cardio.read'):
+        cardioList = readFile(cardioFile, state['entries'], None)
+    with timed('cardio.columns'):
+        cardioColumns = getColumns(cardioFile, cardioList, 'cardio')
+        series = {name: cardioColumns.live(name) for name in ('date', 'speed', 'distance', 'time')}
+
+    # Calculate weekly and monthly averages
+    with timed('cardio.averages'):
+        averages = []
+        for days in averageWindows:
+            average = windowAverages(cardioFile, cardioColumns, ['speed', 'distance', 'time'], days)
+            averages.append(f"{days} Day Average:   {round(average['distance'], 2)} Miles:   {round(average['time'], 2)} Minutes,   {round(average['speed'], 2)} MPH")
+
+    # Weekly and monthly totals, paces and best efforts, only worked out again when the log changed
+    with timed('cardio.rollups'):
+        rollups = cardioRollups(cardioFile, cardioColumns)
+        today = np.datetime64(datetime.today().date(), 'D')
+        current = {'week': ((today.astype(np.int64) + 3) // 7 * 7 - 3).astype('datetime64[D]'), 'month': today.astype('datetime64[M]').astype('datetime64[D]')}
+        for period in ('week', 'month'):
+            totals = rollups[period]
+            # The newest period with runs is only this one if a run was logged in it
+            row = -1 if len(totals['start']) and totals['start'][-1] == current[period] else None
+            miles, minutes, pace = (0.0, 0.0, 0.0) if row is None else (totals['distance'][row], totals['time'][row], totals['pace'][row])
+            averages.append(f"This {period.title()}:   {miles:.2f} Miles:   {minutes:.2f} Minutes,   {int(pace)}:{int(pace % 1 * 60):02d} /Mile")
+    return {'entries': cardioList, 'columns': cardioColumns, 'series': series, 'averages': averages, 'rollups': rollups}
+
+def show_cardio(window, state, data):
+    """
+    Function to fill the cardio screen with the loaded cardio log, its averages and the speed, distance and time graph.
+    """
+    cardioList = state['entries'] = data['entries']
+    cardioColumns, series = data['columns'], data['series']
+
+    # Show the current page of entries, seconds get a leading zero if needed
+    with timed('cardio.log'):
+        allSpeeds = cardioColumns['speed']
+        render_log(window, 'cardio', cardioFile, cardioList, lambda number, i: f'{number}. {i["distance"]} Miles: {i["minutes"]}:{i["seconds"].zfill(2)}, {round(float(allSpeeds[cardioColumns.row(i["id"])]), 2)} MPH        -        {i["date"]}')
+
+    # Update weekly and monthly average text in window
+    window[('cardio', 'WEEKLY')].update('\n'.join(data['averages']))
+
+    # Push speed, distance, and time into the graph and redraw it
+    with timed('cardio.graph'):
+        graph = screen_graph('cardio', window)
+        if graph and not show_chart(window, graph, chart_key('cardio', cardioFile)):
+            update_line(graph, 'Speed', series['date'], series['speed'], marker='o')
+            update_line(graph, 'Distance', series['date'], series['distance'], marker='v')
+            update_line(graph, 'Time', series['date'], series['time'], marker='s')
+            redraw_graph(graph, datetime(2024, 1, 17), ybottom=0)
+
+    # Mileage of every week and month, best efforts and pace histogram
+    with timed('cardio.rollups.show'):
+        rollups = data['rollups']
+        graph = screen_graph('rollups', window, ('cardio', '-ROLLUPS-'))
+        if graph and not show_chart(window, graph, chart_key('rollups', cardioFile)):
+            for period in ('week', 'month'):
+                update_line(graph, f'{period.title()}ly Miles', rollups[period]['start'], rollups[period]['distance'])
+            redraw_graph(graph, datetime(2024, 1, 17), ybottom=0)
+        window[('cardio', '-BESTS-')].update(values=[[label, runs, f'{distance:.2f}', f'{int(minutes)}:{int(minutes % 1 * 60):02d}', f'{speed:.2f}', date.strftime('%m-%d-%Y')] for label, runs, distance, minutes, speed, date in rollups['bests']])
+        window[('cardio', '-PACES-')].update(values=[[f'{pace}:00 - {pace + 1}:00' if pace < maxPace else f'{pace}:00 +', count] for pace, count in rollups['paces']])
+
+def add_cardio(window, cardioList):
+    """
+    Function to ask for a distance and time and add them to the cardio log.
+    """
+    window.hide()
+
+    # Get distance input from user
+    entry1 = sg.PopupGetText('Distance in miles: ')
+
+    # Validate distance input
+    if entry1 is None or not entry1.replace('.', '', 1).isdigit():
+        # Show error message and unhide window
+        window.un_hide()
+        pass
+    else:
+        # Get minutes input from user
+        entry2 = sg.PopupGetText('Minutes: ')
+
+        # Validate minutes input
+        if entry2 is None or not entry2.isdigit():
+            # Show error message and unhide window
+            window.un_hide()
+            pass
+        else:
+            # Get seconds input from user
+            entry3 = sg.PopupGetText('Seconds: ')
+
+            # Validate seconds input
+            if entry3 is None or not entry3.isdigit():
+                # Show error message and unhide window
+                window.un_hide()
+                pass
+            else:
+                # Create new entry dictionary
+                entry = {
+                    'distance': entry1,
+                    'minutes': entry2,
+                    'seconds': entry3,
+                    'date': datetime.today().strftime('%m-%d-%Y')
+                }
+
+                # Add entry to list and update file
+                add_entry(window, cardioList, cardioFile, entry)
+
+def load_meditation(state):
+    """
+    Function to read the meditation log and work out its averages, run on a worker thread.
+    """
+    # Read data from meditation file and update list
+    with timed('meditation.read'):
+        meditationList = readFile(meditationFile, state['entries'], None)
+    with timed('meditation.columns'):
+        meditationColumns = getColumns(meditationFile, meditationList, 'meditation')
+        series = {name: meditationColumns.live(name) for name in ('date', 'rating', 'length')}
+
+    # Calculate weekly and monthly averages
+    with timed('meditation.averages'):
+        averages = []
+        for days in averageWindows:
+            average = windowAverages(meditationFile, meditationColumns, ['rating', 'length'], days)
+            averages.append(f"{days} Day Average:   {round(average['rating'], 2)}/10:   {round(average['length'], 2)} Minutes")
+
+    # Rating and length of every combination of position, sound and setting
+    with timed('meditation.factors'):
+        factors = meditationCrossTab(meditationFile, meditationColumns)
+    return {'entries': meditationList, 'series': series, 'averages': averages, 'factors': factors}
+
+def show_meditation(window, state, data):
+    """
+    Function to fill the meditation screen with the loaded meditation log, its averages and the rating and minutes graph.
+    """
+    meditationList = state['entries'] = data['entries']
+    series = data['series']
+
+    # Show the current page of entries
+    with timed('meditation.log'):
+        render_log(window, 'meditation', meditationFile, meditationList, lambda number, i: f'{number}. {i["rating"]}/10:   {i["length"]} Minutes,   {i["position"]}, {i["inorout"]}, {i["sound"]}        -        {i["date"]}')
+
+    # Update weekly and monthly average text in window
+    window[('meditation', 'WEEKLY')].update('\n'.join(data['averages']))
+    state['factors'] = data['factors']
+    sort_factors(window, state)
+
+    # Push ratings and time into the graph and redraw it
+    with timed('meditation.graph'):
+        graph = screen_graph('meditation', window)
+        if graph and not show_chart(window, graph, chart_key('meditation', meditationFile)):
+            update_line(graph, 'Rating', series['date'], series['rating'], marker='o')
+            update_line(graph, 'Minutes', series['date'], series['length'], marker='s')
+            redraw_graph(graph, datetime(2024, 1, 17), ybottom=0)
+
+def sort_factors(window, state, column=None):
+    """
+    Function to show the meditation factor table sorted by a column.
+    Clicking the heading of the column it's sorted by flips the order, numbers sort highest first.
+    """
+    sortColumn, descending = state['factorSort']
+    if column is not None:
+        sortColumn, descending = column, (not descending if column == sortColumn else column >= len(meditationFactors))
+        state['factorSort'] = (sortColumn, descending)
+    rows = sorted(state['factors'], key=lambda row: row[sortColumn], reverse=descending)
+    window[('meditation', '-FACTORS-')].update(values=[row[:4] + [f'{row[4]:.2f}', f'{row[5]:.1f}'] for row in rows])
+
+def add_meditation(window, meditationList):
+    """
+    Function to ask for a rating, length, position, sound and place and add them to the meditation log.
+    """
+    window.hide()
+
+    # Get rating input from user
+    entry1 = sg.PopupGetText('Rating from 0 - 10: ')
+
+    # Validate rating input
+    if entry1 is None or not entry1.replace('.', '', 1).isdigit() or int(entry1) < 0 or int(entry1) > 10:
+        # Show error message and unhide window
+        window.un_hide()
+        pass
+    else:
+        # Get length input from user
+        entry2 = sg.PopupGetText('Length in minutes: ')
+
+        # Validate length input
+        if entry2 is None or not entry2.replace('.', '', 1).isdigit():
+            # Show error message and unhide window
+            window.un_hide()
+            pass
+        else:
+            # Open window to choose sitting or laying position
+            entry3Window = sg.Window('Sitting or Laying?', layout=[[sg.Button('Sitting'), sg.Button('Laying'), sg.Button('Cancel')]])
+            entry3, values = entry3Window.read()
+            entry3Window.close()
+
+            # If user cancels, unhide the meditation window
+            if entry3 == 'Cancel':
+                window.un_hide()
+                pass
+            else:
+                # If laying, ask if it was yesterday
+                yesterday = 'No'
+                if entry3 == 'Laying':
+                    yesterday = sg.popup_yes_no('Was the meditation yesterday?')
+
+                # Open window to choose sound type
+                entry4Window = sg.Window('Sound?', layout=[[sg.Button('Music'), sg.Button('Ambience'), sg.Button('Music + Ambience'), sg.Button('Silent'), sg.Button('Guided'), sg.Button('Cancel')]])
+                entry4, values = entry4Window.read()
+                entry4Window.close()
+
+                # If user cancels, unhide the meditation window
+                if entry4 == 'Cancel':
+                    window.un_hide()
+                    pass
+                else:
+                    # Open window to choose inside or outside location
+                    entry5Window = sg.Window('Inside or Outside?', layout=[[sg.Button('Inside'), sg.Button('Outside'), sg.Button('Cancel')]])
+                    entry5, values = entry5Window.read()
+                    entry5Window.close()
+
+                    # If user cancels, unhide the meditation window
+                    if entry5 == 'Cancel':
+                        window.un_hide()
+                        pass
+                    else:
+                        # Create new entry dictionary with user input
+                        entry = {
+                            'rating': entry1,
+                            'length': entry2,
+                            'position': entry3,
+                            'sound': entry4,
+                            'inorout': entry5,
+                            'date': datetime.today().strftime('%m-%d-%Y')
+                        }
+
+                        # If meditation was yesterday, update date
+                        if yesterday == 'Yes':
+                            entry['date'] = (datetime.today() - timedelta(days=1)).strftime('%m-%d-%Y')
+
+                        # Add entry to list and update file
+                        add_entry(window, meditationList, meditationFile, entry)
+
+
+# Screens of the window, the name of each is its nav button in lower case
+screens = ['weight', 'strength', 'cardio', 'meditation']
+screenLoad = {'weight': load_weight, 'strength': load_strength, 'cardio': load_cardio, 'meditation': load_meditation}
+screenShow = {'weight': show_weight, 'strength': show_strength, 'cardio': show_cardio, 'meditation': show_meditation}
+screenAdd = {'weight': add_weight, 'strength': add_strength, 'cardio': add_cardio, 'meditation': add_meditation}
+# Entries and other state of each screen, kept for the life of the window
+screenState = {
+    'weight': {'entries': {}, 'goal': None},
+    'strength': {'entries': {}, 'plottedColumns': None, 'plotted': {}, 'exercise': ''},
+    'cardio': {'entries': {}},
+    'meditation': {'entries': {}, 'factors': [], 'factorSort': (4, True)},
+}
+screenShown = {}  # What each screen showed when it was last filled
+screenJobs = {}  # What each screen's load in flight was asked for, None once it's applied
+screenFutures = {}
+screenErrors = {}  # Error of each screen whose last load failed, and the key it failed for (None once it may be retried)
+
+def screen_file(screen):
+    """
+    Function to get the log file shown by a screen.
+    """
+    return {'weight': weightFile, 'strength': strengthFile, 'cardio': cardioFile, 'meditation': meditationFile}[screen]
+
+def screen_key(screen):
+    """
+    Function to get everything a screen's contents depend on, so it's only loaded again when one of them changes.
+    """
+    file = screen_file(screen)
+    return (file, dataVersions.get(file, 0), fileSignature(file), logPages.get(file, 0), screenState[screen].get('exercise'), screenState[screen].get('goal'), plottingLoaded.is_set(), datetime.today().date())
+
+def load_screen(window, screen, key):
+    """
+    Function to load the data of a screen on a worker thread and send it back to the window as a '-LOADED-' event.
+    An error is sent back in place of the data.
+    """
+    try:
+        with dataLock(screen_file(screen)):
+            data = screenLoad[screen](screenState[screen])
+    except Exception as error:
+        data = error
+    window.write_event_value('-LOADED-', (screen, key, data))
+
+def show_screen(window, screen):
+    """
+    Function to start loading a screen on the worker pool, skipped if nothing it shows has changed since it was
+    last filled or if the same load is already running, so switching back to a screen only shows its column again.
+    A load that hasn't started yet is cancelled when a newer one replaces it.
+    """
+    key = screen_key(screen)
+    if screenShown.get(screen) == key or screenJobs.get(screen) == key or screenErrors.get(screen, (None,))[0] == key:
+        return
+    if screen in screenFutures:
+        screenFutures[screen].cancel()
+    screenJobs[screen] = key
+    screenFutures[screen] = workerPool.submit(load_screen, window, screen, key)
+
+def apply_screen(window, screen, key, data):
+    """
+    Function to fill a screen with finished loaded data, on the GUI thread.
+    Data from a load that was replaced by a newer one is dropped.
+    """
+    if screenJobs.get(screen) != key:
+        return
+    screenJobs[screen] = None
+    if isinstance(data, Exception):
+        # The error stays up and the screen can't be edited until a load succeeds, it's retried on the next event
+        screenErrors[screen] = (key, f'Could not load {screen}: {data}')
+        return
+    screenErrors.pop(screen, None)
+    screenShow[screen](window, screenState[screen], data)
+    # The selected exercise can be picked while loading, so remember what was shown after filling
+    screenShown[screen] = screen_key(screen)
+
+def switch_profile(window, name):
+    """
+    Function to make a profile the active one and load the current screen from its logs.
+    Loads still running for the old profile are dropped when they finish.
+    """
+    setProfile(name)
+    for screen in screens:
+        screenState[screen]['entries'] = {}
+    screenState['strength']['exercise'] = ''
+    screenState['weight']['goal'] = readSettings().get('goal')
+    screenJobs.clear()
+    screenShown.clear()
+    screenErrors.clear()
+    window['-PROFILE-'].update(values=listProfiles(), value=name)
+
+def new_profile(window):
+    """
+    Function to ask for the name of a new profile and switch to it.
+    If the name is invalid, it shows a popup with 'Invalid Input'.
+    """
+    window.hide()
+    name = sg.PopupGetText('Profile name: ')
+    if name:
+        try:
+            switch_profile(window, name.strip())
+        except ValueError:
+            sg.popup('Invalid Input', font=(0,10), no_titlebar=True)
+    window.un_hide()
+
+def set_loading(window, screen):
+    """
+    Function to show whether a screen is loading or failed to load, and keep its entries from being edited
+    until a load of them succeeds.
+    """
+    loading = screenJobs.get(screen) is not None
+    error = screenErrors.get(screen)
+    window['-STATUS-'].update('Loading...' if loading else error[1] if error else '')
+    for key in ('Add Entry', 'Delete Entry', ('cardio', 'Import')):
+        window[key].update(disabled=loading or error is not None)
+
+def switch_screen(window, current, screen):
+    """
+    Function to hide the column of the current screen and show the column of another one.
+    """
+    window[(current, '-SCREEN-')].update(visible=False)
+    window[current.title()].update(disabled=False)
+    window[(screen, '-SCREEN-')].update(visible=True)
+    window[screen.title()].update(disabled=True)
+    return screen
+
+def run_window():
+    """
+    Function to run the window of the app until it's closed.
+    Every event of every screen is handled in this one loop, so moving between screens never rebuilds the window.
+    Logs are read and averaged on the worker pool, this loop only applies the results and draws.
+    """
+    global workerPool
+    workerPool = concurrent.futures.ThreadPoolExecutor(max_workers=workerCount)
+    open_window()
+    window = mainWindow
+    loadPlotting(window)  # The graph of the screen being shown is filled in when matplotlib is loaded
+    current = 'weight'
+    screenState['weight']['goal'] = readSettings().get('goal')
+    while True:
+        show_screen(window, current)
+        set_loading(window, current)
+        if profiling:
+            window['-DEBUG-'].update(profileSummary())
+
+        # Read the user's choice from the window
+        event, values = window.read()
+        if event in ('Exit', sg.WIN_CLOSED):
+            break
+        state = screenState[current]
+        if current == 'strength' and values.get(('strength', 'OPTIONS')):
+            state['exercise'] = values[('strength', 'OPTIONS')]
+
+        if event != '-LOADED-':
+            # Failed loads are tried again on the next thing the user does
+            for screen, (key, error) in screenErrors.items():
+                screenErrors[screen] = (None, error)
+
+        if event == '-LOADED-':
+            screen, key, data = values['-LOADED-']
+            with timed(screen + '.show'):
+                apply_screen(window, screen, key, data)
+        elif event in [screen.title() for screen in screens]:
+            current = switch_screen(window, current, event.lower())
+        elif event == 'Add Entry':
+            screenAdd[current](window, state['entries'])
+        elif event == 'Delete Entry':
+            delete_entry(window, state['entries'], screen_file(current))
+        elif event == ('cardio', 'Import'):
+            import_cardio(window, state['entries'])
+        elif event == ('weight', 'Goal'):
+            set_goal(window, state)
+        elif event == '-PROFILE-':
+            switch_profile(window, values['-PROFILE-'])
+        elif event == 'New Profile':
+            new_profile(window)
+        elif isinstance(event, tuple) and event[0] == ('meditation', '-FACTORS-'):
+            # Clicking a heading sorts the factor table by its column
+            if event[2][0] == -1 and event[2][1] is not None:
+                sort_factors(window, screenState['meditation'], event[2][1])
+        elif isinstance(event, tuple) and event[1].endswith('-IMAGE-'):
+            live_chart(event)
+        elif isinstance(event, tuple) and event[1] in ('Older', 'Newer'):
+            turn_page(screen_file(event[0]), event[1])
+        # '-PLOT-READY-' and 'Update' need nothing else, the screen is loaded again at the top of the loop
+
+    workerPool.shutdown(wait=False, cancel_futures=True)
+    window.close()
+    flushWrites()
+    writeProfile()
+
+
+
+
+# Menus and fonts using PySimpleGUI
+buttonFont = ('Courier', 23)
+titleFont = ('Courier', 30)
+textFont = ('Arial Italic', 11)
+
+def screen_layout(screen):
+    """
+    Function to build the layout of one screen.
+    Every key is a (screen, name) tuple so all the screens can live in the same window.
+    """
+    TitleCol = [
+        [sg.Text(f'7 Day Average: \nLast 14 Days: ', key=(screen, 'WEEKLY'), justification='center', font=textFont)]
+        + ([sg.OptionMenu(values=[1], key=(screen, 'OPTIONS'), default_value='Test'), sg.Button('Update', key=(screen, 'Update'))] if screen == 'strength' else [])
+        + ([sg.Button('Import', key=(screen, 'Import'))] if screen == 'cardio' else [])
+        + ([sg.Button('Goal', key=(screen, 'Goal'))] if screen == 'weight' else [])
+        + [sg.Push(), sg.Text(screen.title(), justification='center', font=titleFont), sg.Push()]
+    ]
+    LineCol = [
+        [sg.Multiline(size=(80, 30), key=(screen, '-OUTPUT-'), background_color='black', text_color='white', disabled=True, autoscroll=True, font=textFont),sg.pin(sg.Canvas(size=(400, 400), key=(screen, '-CANVAS-'))), sg.pin(sg.Image(key=chart_image((screen, '-CANVAS-')), visible=False, enable_events=True))],
+        [sg.Button('Older', key=(screen, 'Older'), font=textFont), sg.Text('', key=(screen, '-PAGE-'), font=textFont), sg.Button('Newer', key=(screen, 'Newer'), font=textFont)]
+    ]
+    if screen == 'strength':
+        # Bests and tonnage of every exercise
+        headings = ['Exercise', 'Best 1RM'] + [f'{days} Day Best' for days in averageWindows] + ['Lbs This Week', 'Lbs Last Week']
+        LineCol.append([sg.Table(values=[], headings=headings, key=(screen, '-SUMMARY-'), num_rows=6, auto_size_columns=False, col_widths=[14] + [12] * (len(headings) - 1), justification='center', font=textFont)])
+    elif screen == 'cardio':
+        # Weekly and monthly mileage, best effort of every distance and how many runs were at each pace
+        LineCol.append([
+            sg.pin(sg.Canvas(size=(400, 250), key=(screen, '-ROLLUPS-'))),
+            sg.pin(sg.Image(key=chart_image((screen, '-ROLLUPS-')), visible=False, enable_events=True)),
+            sg.Table(values=[], headings=['Distance', 'Runs', 'Miles', 'Time', 'Best MPH', 'Date'], key=(screen, '-BESTS-'), num_rows=6, auto_size_columns=False, col_widths=[14, 6, 8, 8, 9, 11], justification='center', font=textFont),
+            sg.Table(values=[], headings=['Pace /Mile', 'Runs'], key=(screen, '-PACES-'), num_rows=6, auto_size_columns=False, col_widths=[14, 6], justification='center', font=textFont),
+        ])
+    elif screen == 'meditation':
+        # Sessions, mean rating and mean length of every combination of position, sound and setting, click a heading to sort
+        LineCol.append([sg.Table(values=[], headings=['Position', 'Sound', 'Setting', 'Sessions', 'Mean Rating', 'Mean Minutes'], key=(screen, '-FACTORS-'), num_rows=8, auto_size_columns=False, col_widths=[10, 16, 10, 9, 11, 12], justification='center', enable_click_events=True, font=textFont)])
+    return [
+        [sg.Column(TitleCol, element_justification='center', expand_x=True)],
+        [sg.Column(LineCol, element_justification='left', expand_x=True)]
+    ]
+
+def open_window():
+    global mainWindow
+    # One column per screen, only the current one is visible
+    Layout = [
+        [sg.Column(screen_layout(screen), key=(screen, '-SCREEN-'), visible=screen == 'weight', expand_x=True) for screen in screens],
+        # Latency of every phase, only shown when profiling
+        [sg.Multiline('', key='-DEBUG-', size=(120, 8), disabled=True, font=('Courier', 10), visible=profiling)],
+        [sg.Button('Exit', font=buttonFont), sg.Combo(listProfiles(), default_value=activeProfile, key='-PROFILE-', enable_events=True, readonly=True, font=textFont), sg.Button('New Profile', font=textFont), sg.Text('', key='-STATUS-', font=textFont), sg.Push()] + [sg.Button(screen.title(), font=buttonFont, disabled=screen == 'weight') for screen in screens] + [sg.Push(), sg.Button('Add Entry', font=buttonFont), sg.Button('Delete Entry', font=buttonFont)]
+        ]
+    mainWindow = sg.Window(title=windowTitle, layout=Layout, margins=(15,75), use_custom_titlebar=True, finalize=True, keep_on_top=True, titlebar_icon=titlebarIcon)
+
+
+
+# Run Code
+def main():
+    global averageWindows, storageBackend, logPageSize, profiling
+    parser = argparse.ArgumentParser(description=windowTitle)
+    parser.add_argument('--windows', type=int, nargs='+', default=averageWindows, metavar='DAYS', help='days covered by each average, e.g. --windows 7 30 90 365')
+    parser.add_argument('--page-size', type=int, default=logPageSize, help='entries shown per page of the log, 0 shows every entry')
+    parser.add_argument('--storage', choices=['journal', 'sqlite'], default=storageBackend, help='where the logs are kept')
+    parser.add_argument('--migrate-sqlite', action='store_true', help='copy the JSON logs into SQLite and exit')
+    parser.add_argument('--import-cardio', nargs='+', metavar='FILE', help='import runs from GPX, TCX or CSV files into the cardio log and exit')
+    parser.add_argument('--export', metavar='FOLDER', help='export every log to CSV and .npz files in FOLDER and exit')
+    parser.add_argument('--user', default=defaultProfile, metavar='PROFILE', help=f'profile to open, its logs are kept in {profilesFolder}/PROFILE (created if new)')
+    parser.add_argument('--check-startup', action='store_true', help='measure import time with -X importtime and fail if it is over budget')
+    parser.add_argument('--profile', action='store_true', default=profiling, help=f'time every phase of filling a screen, shown in a debug panel and written to {profileLog} on exit')
+    args = parser.parse_args()
+    if args.check_startup:
+        sys.exit(checkStartup())
+    averageWindows = args.windows
+    logPageSize = args.page_size
+    profiling = args.profile
+    setProfile(args.user)
+    storageBackend = args.storage
+    if args.migrate_sqlite:
+        migrateToSqlite([weightFile, strengthFile, cardioFile, meditationFile])
+        return
+    if args.export:
+        exportLogs(args.export)
+        return
+    if args.import_cardio:
+        print(importSummary(importCardio(args.import_cardio, readFile(cardioFile, {}, None))))
+        return
+    loadPlotting()  # Import matplotlib while the window is being built
+    run_window()
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""
+Tests of the snapshot + journal storage of fitness.py: replaying the journal, recovering from a torn
+last line and compacting the journal into the snapshot.
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fitness
+
+
+class StorageTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = os.getcwd()
+        self.workdir = tempfile.TemporaryDirectory()
+        os.chdir(self.workdir.name)
+        self.file = 'weight.json'
+        self.restart()
+
+    def tearDown(self):
+        fitness.flushWrites()
+        while fitness.compacting:
+            pass
+        os.chdir(self.folder)
+        self.workdir.cleanup()
+
+    def restart(self):
+        """
+        Forget everything fitness.py holds in memory, as if the app was started again.
+        """
+        fitness.flushWrites()
+        for state in (fitness.datasetCache, fitness.columnCache, fitness.dataVersions, fitness.nextIds, fitness.journalCounts):
+            state.clear()
+
+    def load(self):
+        return fitness.readFile(self.file, {}, None)
+
+    def add(self, entries, weight):
+        fitness.store_entry(entries, self.file, {'weight': weight, 'date': '01-02-2026'})
+
+    def test_replay(self):
+        entries = self.load()
+        for weight in ('180', '181', '182'):
+            self.add(entries, weight)
+        fitness.remove_entry(entries, self.file, 2)
+        self.restart()
+        entries = self.load()
+        self.assertEqual([(i['id'], i['weight']) for i in entries.values()], [(1, '180'), (3, '182')])
+        self.assertEqual(fitness.nextIds[self.file], 4)
+
+    def test_torn_line(self):
+        entries = self.load()
+        self.add(entries, '180')
+        fitness.flushWrites()
+        # A crash in the middle of an append leaves half a record without a newline
+        with open(self.file + fitness.journalSuffix, 'a') as f:
+            f.write('{"op": "add", "entry": {"wei')
+        self.restart()
+        entries = self.load()
+        self.assertEqual([i['weight'] for i in entries.values()], ['180'])
+        self.add(entries, '181')
+        self.restart()
+        entries = self.load()
+        self.assertEqual([i['weight'] for i in entries.values()], ['180', '181'])
+        with open(self.file + fitness.journalSuffix) as f:
+            for line in f:
+                json.loads(line)
+
+    def test_compaction(self):
+        entries = self.load()
+        for i in range(5):
+            self.add(entries, str(180 + i))
+        fitness.remove_entry(entries, self.file, 5)
+        fitness.compactFile(self.file)
+        with open(self.file) as f:
+            self.assertEqual([i['id'] for i in json.load(f)], [1, 2, 3, 4])
+        self.restart()
+        entries = self.load()
+        self.assertEqual(list(entries), [1, 2, 3, 4])
+        # The id of the deleted entry is never handed out again
+        self.add(entries, '190')
+        self.assertEqual(list(entries), [1, 2, 3, 4, 6])
+
+    def test_compaction_keeps_cache(self):
+        entries = self.load()
+        for weight in ('180', '181', '182'):
+            self.add(entries, weight)
+        fitness.compactFile(self.file)
+        # The entries already held are served again rather than read back from the compacted files
+        self.assertIs(self.load(), entries)
+
+    def test_compaction_crash(self):
+        entries = self.load()
+        for weight in ('180', '181', '182', '183'):
+            self.add(entries, weight)
+        fitness.remove_entry(entries, self.file, 4)
+        fitness.flushWrites()
+        with open(self.file + fitness.journalSuffix) as f:
+            journal = f.read()
+        fitness.compactFile(self.file)
+        # A crash after the snapshots were replaced but before the journal was leaves the old journal behind
+        with open(self.file + fitness.journalSuffix, 'w') as f:
+            f.write(journal)
+        self.restart()
+        entries = self.load()
+        self.assertIsInstance(entries, fitness.SnapshotEntries)
+        self.assertEqual([(i['id'], i['weight']) for i in entries.values()], [(1, '180'), (2, '181'), (3, '182')])
+        self.add(entries, '190')
+        self.assertEqual(list(entries), [1, 2, 3, 5])
+
+    def test_snapshot_entries(self):
+        entries = self.load()
+        for weight in ('180', '181.5', '182'):
+            self.add(entries, weight)
+        fitness.compactFile(self.file)
+        self.restart()
+        # Loaded from the binary snapshot, with adds and deletes on top of it
+        entries = self.load()
+        self.assertIsInstance(entries, fitness.SnapshotEntries)
+        self.add(entries, '183')
+        fitness.remove_entry(entries, self.file, 2)
+        self.assertEqual(len(entries), 3)
+        self.assertNotIn(2, entries)
+        self.assertEqual(entries[4]['weight'], '183')
+        self.assertEqual([i['weight'] for i in reversed(entries.values())], ['183', '182', '180'])
+        columns = fitness.getColumns(self.file, entries, 'weight')
+        self.assertEqual(columns.live('weight').tolist(), [180.0, 182.0, 183.0])
+        self.assertIsNone(columns.row(2))
+        self.restart()
+        entries = self.load()
+        self.assertEqual([(i['id'], i['weight']) for i in entries.values()], [(1, '180'), (3, '182'), (4, '183')])
+
+
+if __name__ == '__main__':
+    unittest.main()